@@ -77,13 +77,15 @@ const ChatInterface = () => {
       // Check if response contains transaction data for wallet extension
       if (data.response.includes('tx_data:')) {
         try {
-          // Parse the transaction data with the new format
-          // Format: tx_data:toAddress:valueHex:valueWei
-          const txDataMatch = data.response.match(/tx_data:(0x[a-fA-F0-9]+):(0x[a-fA-F0-9]+):(\d+)/);
+          // Parse the transaction data
+          // Format: tx_data:{"to": ..., "value_hex": ..., "value_wei": ...}
+          const txData = JSON.parse(
+            data.response.slice(data.response.indexOf('tx_data:') + 'tx_data:'.length)
+          );
           
-          if (txDataMatch && window.ethereum && account) {
-            const toAddress = txDataMatch[1];
-            const valueHex = txDataMatch[2]; // Use hex value for precision
+          if (txData && window.ethereum && account) {
+            const toAddress = txData.to;
+            const valueHex = txData.value_hex; // Use hex value for precision
             
             console.log('Transaction data:', {
               from: account,
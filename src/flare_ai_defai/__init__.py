@@ -1,4 +1,4 @@
-from flare_ai_defai.ai import GeminiProvider
+from flare_ai_defai.ai import GeminiProvider, ResponseCache
 from flare_ai_defai.api import ChatRouter, router
 from flare_ai_defai.attestation import Vtpm
 from flare_ai_defai.blockchain import FlareProvider
@@ -12,6 +12,7 @@ __all__ = [
     "FlareProvider",
     "GeminiProvider",
     "PromptService",
+    "ResponseCache",
     "SemanticRouterResponse",
     "Vtpm",
     "router",
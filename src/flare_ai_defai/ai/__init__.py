@@ -5,8 +5,10 @@ from .base import (
     GenerationConfig,
     ModelResponse,
 )
+from .cache import ResponseCache
 from .gemini import GeminiProvider
 from .openrouter import AsyncOpenRouterProvider, OpenRouterProvider
+from .parsing import safe_json_loads
 
 __all__ = [
     "AsyncOpenRouterProvider",
@@ -17,4 +19,6 @@ __all__ = [
     "GenerationConfig",
     "ModelResponse",
     "OpenRouterProvider",
+    "ResponseCache",
+    "safe_json_loads",
 ]
@@ -62,6 +62,25 @@ class BaseAIProvider(ABC):
             ModelResponse containing the generated text and metadata
         """
 
+    @abstractmethod
+    async def agenerate(
+        self,
+        prompt: str,
+        response_mime_type: str | None = None,
+        response_schema: Any | None = None,
+    ) -> ModelResponse:
+        """Asynchronously generate a response without maintaining conversation context
+
+        Args:
+            prompt: Input text prompt
+            response_mime_type: Expected response format
+                (e.g., "text/plain", "application/json")
+            response_schema: Expected response structure schema
+
+        Returns:
+            ModelResponse containing the generated text and metadata
+        """
+
     @abstractmethod
     def send_message(self, msg: str) -> ModelResponse:
         """Send a message in a conversational context
@@ -73,6 +92,17 @@ class BaseAIProvider(ABC):
             ModelResponse containing the response text and metadata
         """
 
+    @abstractmethod
+    async def asend_message(self, msg: str) -> ModelResponse:
+        """Asynchronously send a message in a conversational context
+
+        Args:
+            msg: Input message text
+
+        Returns:
+            ModelResponse containing the response text and metadata
+        """
+
 
 class CompletionRequest(TypedDict):
     model: str
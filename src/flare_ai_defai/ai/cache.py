@@ -0,0 +1,265 @@
+"""
+Response Cache Module
+
+This module implements a two-tier cache for AI provider responses. The first
+tier is an exact-match LRU keyed by ``(kind, normalized_input)``. The second
+tier compares input embeddings by cosine similarity so that paraphrased inputs
+can reuse an earlier response. Entries in both tiers expire after a TTL.
+
+Inputs containing digits (amounts, addresses) are never cached, since a
+near-identical message with a different number must not share a response.
+Only stateless responses may be cached; a response that depends on chat
+history must not be served to another conversation.
+
+Example:
+    ```python
+    cache = ResponseCache()
+    if (text := cache.get("semantic_router", message)) is None:
+        text = ai.generate(prompt).text
+        cache.put("semantic_router", message, text)
+    ```
+"""
+
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_UNCACHEABLE = re.compile(r"\d")
+# Number of lookups between `cache_stats` log events
+STATS_INTERVAL = 1000
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached model response.
+
+    Attributes:
+        response (str): Cached response text
+        created_at (float): Monotonic timestamp of when the entry was stored
+    """
+
+    response: str
+    created_at: float
+
+
+class ResponseCache:
+    """
+    Two-tier (exact + semantic) cache for model responses.
+
+    Attributes:
+        max_size (int): Maximum number of entries in the exact-match tier
+        ttl (float): Seconds after which an entry expires
+        similarity_threshold (float): Minimum cosine similarity for a semantic hit
+        max_semantic_size (int): Maximum number of vectors kept per kind
+        semantic (bool): Whether callers should supply embeddings for lookups
+        hits (int): Number of cache hits served
+        misses (int): Number of cache misses
+    """
+
+    def __init__(
+        self,
+        max_size: int = 4096,
+        ttl: float = 3600.0,
+        similarity_threshold: float = 0.92,
+        max_semantic_size: int = 1024,
+        *,
+        semantic: bool = False,
+    ) -> None:
+        """
+        Initialize an empty response cache.
+
+        Args:
+            max_size: Maximum number of entries in the exact-match tier
+            ttl: Seconds after which an entry expires
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            max_semantic_size: Maximum number of vectors kept per kind
+            semantic: Whether callers should supply embeddings for lookups
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.max_semantic_size = max_semantic_size
+        self.semantic = semantic
+        self.hits = 0
+        self.misses = 0
+        self._exact: OrderedDict[tuple[str, str], CacheEntry] = OrderedDict()
+        self._vectors: dict[str, np.ndarray] = {}
+        self._entries: dict[str, list[CacheEntry]] = {}
+        self.logger = logger.bind(service="response_cache")
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Normalize input text so trivially different messages share a key.
+
+        Args:
+            text: Raw input text
+
+        Returns:
+            str: Lowercased text with collapsed whitespace and no trailing punctuation
+        """
+        return _WHITESPACE.sub(" ", text).strip().rstrip("?!.").lower()
+
+    @staticmethod
+    def is_cacheable(text: str) -> bool:
+        """
+        Check whether responses for the given input may be cached.
+
+        Args:
+            text: Raw input text
+
+        Returns:
+            bool: False if the input contains digits (amounts, addresses)
+        """
+        return _UNCACHEABLE.search(text) is None
+
+    def get(self, kind: str, text: str, embedding: Sequence[float] | None = None) -> str | None:
+        """
+        Look up a cached response.
+
+        Args:
+            kind: Prompt template name the response was generated for
+            text: Raw input text
+            embedding: Optional embedding of the normalized input for the
+                semantic tier
+
+        Returns:
+            str | None: Cached response text, or None on a miss
+        """
+        key = (kind, self.normalize(text))
+        now = time.monotonic()
+
+        entry = self._exact.get(key)
+        if entry is not None:
+            if now - entry.created_at < self.ttl:
+                self._exact.move_to_end(key)
+                return self._hit(kind, "exact", entry)
+            del self._exact[key]
+
+        if embedding is not None:
+            entry = self._semantic_lookup(kind, embedding, now)
+            if entry is not None:
+                self._put_exact(key, entry)
+                return self._hit(kind, "semantic", entry)
+
+        self.misses += 1
+        self._log_stats()
+        return None
+
+    def get_exact(self, kind: str, text: str) -> str | None:
+        """
+        Look up a cached response in the exact-match tier only.
+
+        Lets callers skip computing an embedding when the exact tier already
+        has the response. A miss is not counted, since it is expected to be
+        followed by a full `get`.
+
+        Args:
+            kind: Prompt template name the response was generated for
+            text: Raw input text
+
+        Returns:
+            str | None: Cached response text, or None on a miss
+        """
+        key = (kind, self.normalize(text))
+        entry = self._exact.get(key)
+        if entry is None or time.monotonic() - entry.created_at >= self.ttl:
+            return None
+        self._exact.move_to_end(key)
+        return self._hit(kind, "exact", entry)
+
+    def put(
+        self, kind: str, text: str, response: str, embedding: Sequence[float] | None = None
+    ) -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            kind: Prompt template name the response was generated for
+            text: Raw input text
+            response: Response text to cache
+            embedding: Optional embedding of the normalized input for the
+                semantic tier
+        """
+        entry = CacheEntry(response=response, created_at=time.monotonic())
+        self._put_exact((kind, self.normalize(text)), entry)
+        if embedding is not None:
+            self._put_semantic(kind, embedding, entry)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._exact.clear()
+        self._vectors.clear()
+        self._entries.clear()
+
+    def _hit(self, kind: str, tier: str, entry: CacheEntry) -> str:
+        self.hits += 1
+        self.logger.debug("cache_hit", kind=kind, tier=tier, hits=self.hits)
+        self._log_stats()
+        return entry.response
+
+    def _log_stats(self) -> None:
+        lookups = self.hits + self.misses
+        if lookups % STATS_INTERVAL == 0:
+            self.logger.info(
+                "cache_stats",
+                hits=self.hits,
+                misses=self.misses,
+                hit_rate=round(self.hits / lookups, 3),
+            )
+
+    def _put_exact(self, key: tuple[str, str], entry: CacheEntry) -> None:
+        self._exact[key] = entry
+        self._exact.move_to_end(key)
+        if len(self._exact) > self.max_size:
+            self._exact.popitem(last=False)
+
+    def _semantic_lookup(
+        self, kind: str, embedding: Sequence[float], now: float
+    ) -> CacheEntry | None:
+        vectors = self._vectors.get(kind)
+        if vectors is None:
+            return None
+        query = _unit(embedding)
+        if query is None or query.shape[0] != vectors.shape[1]:
+            return None
+        similarities = vectors @ query
+        best = int(np.argmax(similarities))
+        entry = self._entries[kind][best]
+        if similarities[best] < self.similarity_threshold or now - entry.created_at >= self.ttl:
+            return None
+        return entry
+
+    def _put_semantic(self, kind: str, embedding: Sequence[float], entry: CacheEntry) -> None:
+        vector = _unit(embedding)
+        if vector is None:
+            return
+        vectors = self._vectors.get(kind)
+        entries = self._entries.setdefault(kind, [])
+        if vectors is None or vectors.shape[1] != vector.shape[0]:
+            vectors = np.empty((0, vector.shape[0]), dtype=np.float32)
+            entries.clear()
+
+        # Drop expired rows and keep the newest max_semantic_size - 1 entries
+        cutoff = entry.created_at - self.ttl
+        keep = [i for i, e in enumerate(entries) if e.created_at > cutoff]
+        keep = keep[-(self.max_semantic_size - 1) :] if self.max_semantic_size > 1 else []
+        self._vectors[kind] = np.vstack([vectors[keep], vector])
+        self._entries[kind] = [entries[i] for i in keep] + [entry]
+
+
+def _unit(embedding: Sequence[float]) -> np.ndarray | None:
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if vector.ndim != 1 or norm == 0.0:
+        return None
+    return vector / norm
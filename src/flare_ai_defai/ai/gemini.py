@@ -6,6 +6,7 @@ with Google's Generative AI service. It handles chat sessions, content generatio
 and message management while maintaining a consistent AI personality.
 """
 
+import asyncio
 from typing import Any, override
 
 import google.generativeai as genai
@@ -16,6 +17,8 @@ from flare_ai_defai.ai.base import BaseAIProvider, ModelResponse
 
 logger = structlog.get_logger(__name__)
 
+DEFAULT_EMBEDDING_MODEL = "models/text-embedding-004"
+DEFAULT_MAX_CONCURRENCY = 8
 
 SYSTEM_INSTRUCTION = """
 You are Artemis, an AI assistant specialized in helping users navigate
@@ -59,19 +62,31 @@ class GeminiProvider(BaseAIProvider):
     Attributes:
         chat (genai.ChatSession | None): Active chat session
         model (genai.GenerativeModel): Configured Gemini model instance
+        embedding_model (str): Gemini model used for text embeddings
+        _semaphore (asyncio.Semaphore): Caps concurrent async requests to Gemini
+        _chat_lock (asyncio.Lock): Serializes chat turns so each one is recorded
+            in the shared chat history
         chat_history (list[ContentDict]): History of chat interactions
         logger (BoundLogger): Structured logger for the provider
     """
 
-    def __init__(self, api_key: str, model: str, **kwargs: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **kwargs: str,
+    ) -> None:
         """
         Initialize the Gemini provider with API credentials and model configuration.
 
         Args:
             api_key (str): Google API key for authentication
             model (str): Gemini model identifier to use
+            max_concurrency (int): Maximum number of in-flight async requests
             **kwargs (str): Additional configuration parameters including:
                 - system_instruction: Custom system prompt for the AI personality
+                - embedding_model: Gemini model used by `aembed`
         """
         genai.configure(api_key=api_key)
         self.chat: genai.ChatSession | None = None
@@ -79,6 +94,9 @@ class GeminiProvider(BaseAIProvider):
             model_name=model,
             system_instruction=kwargs.get("system_instruction", SYSTEM_INSTRUCTION),
         )
+        self.embedding_model = kwargs.get("embedding_model", DEFAULT_EMBEDDING_MODEL)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._chat_lock = asyncio.Lock()
         self.chat_history: list[ContentDict] = [
             ContentDict(parts=["Hi, I'm Artemis"], role="model")
         ]
@@ -125,14 +143,53 @@ class GeminiProvider(BaseAIProvider):
             ),
         )
         self.logger.debug("generate", prompt=prompt, response_text=response.text)
-        return ModelResponse(
-            text=response.text,
-            raw_response=response,
-            metadata={
-                "candidate_count": len(response.candidates),
-                "prompt_feedback": response.prompt_feedback,
-            },
-        )
+        return self._to_model_response(response)
+
+    @override
+    async def agenerate(
+        self,
+        prompt: str,
+        response_mime_type: str | None = None,
+        response_schema: Any | None = None,
+    ) -> ModelResponse:
+        """
+        Generate content using the Gemini model without blocking the event loop.
+
+        Concurrent calls are capped by the provider's semaphore.
+
+        Args:
+            prompt (str): Input prompt for content generation
+            response_mime_type (str | None): Expected MIME type for the response
+            response_schema (Any | None): Schema defining the response structure
+
+        Returns:
+            ModelResponse: Generated content with metadata, see `generate`
+        """
+        async with self._semaphore:
+            response = await self.model.generate_content_async(
+                prompt,
+                generation_config=genai.GenerationConfig(
+                    response_mime_type=response_mime_type, response_schema=response_schema
+                ),
+            )
+        self.logger.debug("agenerate", prompt=prompt, response_text=response.text)
+        return self._to_model_response(response)
+
+    async def aembed(self, text: str) -> list[float]:
+        """
+        Embed text for semantic similarity comparisons without blocking the event loop.
+
+        Args:
+            text (str): Text to embed
+
+        Returns:
+            list[float]: Embedding vector for the text
+        """
+        async with self._semaphore:
+            result = await genai.embed_content_async(
+                model=self.embedding_model, content=text, task_type="semantic_similarity"
+            )
+        return result["embedding"]
 
     @override
     def send_message(
@@ -159,6 +216,34 @@ class GeminiProvider(BaseAIProvider):
             self.chat = self.model.start_chat(history=self.chat_history)
         response = self.chat.send_message(msg)
         self.logger.debug("send_message", msg=msg, response_text=response.text)
+        return self._to_model_response(response)
+
+    @override
+    async def asend_message(self, msg: str) -> ModelResponse:
+        """
+        Send a message in a chat session without blocking the event loop.
+
+        Initializes a new chat session if none exists, using the current chat history.
+        Turns are sent one at a time: the chat session snapshots its history
+        before the request and records the turn after it, so concurrent turns
+        would overwrite each other.
+
+        Args:
+            msg (str): Message to send to the chat session
+
+        Returns:
+            ModelResponse: Response from the chat session, see `send_message`
+        """
+        async with self._chat_lock:
+            if not self.chat:
+                self.chat = self.model.start_chat(history=self.chat_history)
+            async with self._semaphore:
+                response = await self.chat.send_message_async(msg)
+        self.logger.debug("asend_message", msg=msg, response_text=response.text)
+        return self._to_model_response(response)
+
+    @staticmethod
+    def _to_model_response(response: Any) -> ModelResponse:
         return ModelResponse(
             text=response.text,
             raw_response=response,
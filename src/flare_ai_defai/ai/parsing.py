@@ -0,0 +1,126 @@
+"""
+Response Parsing Module
+
+This module provides tolerant JSON parsing for structured model responses.
+Models occasionally wrap JSON in markdown fences, leave trailing commas or
+stop mid-object when they hit a token limit. Recovering locally from these
+errors is much cheaper than issuing another model request.
+
+Example:
+    ```python
+    data = safe_json_loads('```json\\n{"amount": 1.5,}\\n```', ("amount",))
+    assert data == {"amount": 1.5}
+    ```
+"""
+
+import json
+import re
+from collections.abc import Iterable
+from typing import Any
+
+_FENCE = re.compile(r"^\s*```[\w-]*\s*(.*?)\s*(?:```)?\s*$", re.DOTALL)
+_STRING_REST = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+_DANGLING_KEY = re.compile(r',?\s*"(?:[^"\\]|\\.)*"\s*:?\s*$')
+_DANGLING_SEPARATOR = re.compile(r"[,:]\s*$")
+
+
+def safe_json_loads(text: str, required_keys: Iterable[str] = ()) -> dict[str, Any]:
+    """
+    Parse a JSON object from a model response, repairing common errors.
+
+    The text is parsed as-is first. If that fails, markdown fences and any
+    text before the first brace are removed, trailing commas are dropped and
+    a truncated tail is closed before parsing again.
+
+    Args:
+        text: Raw model response text
+        required_keys: Keys that must be present in the parsed object
+
+    Returns:
+        dict[str, Any]: Parsed JSON object
+
+    Raises:
+        ValueError: If the text cannot be recovered into a JSON object or a
+            required key is missing
+    """
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        data = json.loads(_repair(text))
+
+    if not isinstance(data, dict):
+        msg = f"Expected a JSON object, got {type(data).__name__}"
+        raise ValueError(msg)  # noqa: TRY004
+    missing = [key for key in required_keys if key not in data]
+    if missing:
+        msg = f"Missing required keys: {', '.join(missing)}"
+        raise ValueError(msg)
+    return data
+
+
+def _repair(text: str) -> str:
+    if match := _FENCE.match(text):
+        text = match.group(1)
+    start = text.find("{")
+    if start != -1:
+        text = text[start:]
+    return _close_truncated(text.rstrip())
+
+
+def _close_truncated(text: str) -> str:
+    closers, in_string, end, trailing_commas = _scan(text)
+    text = text[:end]
+    for i in reversed(trailing_commas):
+        text = text[:i] + text[i + 1 :]
+    if not closers:
+        return text
+    if in_string:
+        text += '"'
+    if closers[-1] == "}":
+        text = _strip_dangling_key(text)
+    text = _DANGLING_SEPARATOR.sub("", text)
+    return text + "".join(reversed(closers))
+
+
+def _scan(text: str) -> tuple[list[str], bool, int, list[int]]:
+    # Track open brackets and trailing commas outside of strings, stopping
+    # once the top-level value is complete so that any text after it is ignored
+    closers: list[str] = []
+    trailing_commas: list[int] = []
+    comma: int | None = None
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char == '"':
+            match = _STRING_REST.match(text, i + 1)
+            if match is None:
+                return closers, True, len(text), trailing_commas
+            i = match.end() - 1
+            comma = None
+        elif char == ",":
+            comma = i
+        elif char in "}]" and closers:
+            if comma is not None:
+                trailing_commas.append(comma)
+            closers.pop()
+            if not closers:
+                return closers, False, i + 1, trailing_commas
+            comma = None
+        elif not char.isspace():
+            if char in "{[":
+                closers.append("}" if char == "{" else "]")
+            comma = None
+        i += 1
+    return closers, False, len(text), trailing_commas
+
+
+def _strip_dangling_key(text: str) -> str:
+    # A trailing string directly after '{' or ',' inside an object is a key
+    # whose value was cut off, not a complete value
+    match = _DANGLING_KEY.search(text)
+    if match is None:
+        return text
+    head = text[: match.start()]
+    if match.group(0).lstrip().startswith(",") or head.rstrip().endswith("{"):
+        return head
+    return text
@@ -1,3 +1,3 @@
-from .routes.chat import ChatMessage, ChatRouter, router
+from .routes.chat import ChatMessage, ChatRouter, parse_msg, router
 
-__all__ = ["ChatMessage", "ChatRouter", "router"]
+__all__ = ["ChatMessage", "ChatRouter", "parse_msg", "router"]
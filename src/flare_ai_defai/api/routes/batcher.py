@@ -0,0 +1,158 @@
+"""
+Semantic Router Batcher Module
+
+This module coalesces semantic routing requests that arrive within a short
+window into a single model request. Every routing call shares the same prompt
+prefix and only the user input varies, so classifying several inputs at once
+amortizes the request round-trip and prompt prefill across all of them.
+"""
+
+import asyncio
+import json
+
+import structlog
+
+from flare_ai_defai.ai import GeminiProvider
+from flare_ai_defai.exceptions import RoutingError
+from flare_ai_defai.prompts import PromptService, SemanticRouterResponse
+
+logger = structlog.get_logger(__name__)
+
+_QueueItem = tuple[str, asyncio.Future[SemanticRouterResponse]]
+
+
+class SemanticRouterBatcher:
+    """
+    Micro-batches semantic routing requests into shared model calls.
+
+    A background task drains the queue whenever the batch window elapses or
+    `max_batch` messages are waiting, classifies the batch in one request and
+    resolves each caller's future with its route.
+
+    Attributes:
+        ai (GeminiProvider): Provider used for classification requests
+        prompts (PromptService): Service for formatting routing prompts
+        window (float): Seconds to wait for more messages after the first arrives
+        max_batch (int): Maximum number of messages classified per request
+        logger (BoundLogger): Structured logger for the batcher
+    """
+
+    def __init__(
+        self,
+        ai: GeminiProvider,
+        prompts: PromptService,
+        window_ms: float = 15.0,
+        max_batch: int = 16,
+    ) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            ai: Provider used for classification requests
+            prompts: Service for formatting routing prompts
+            window_ms: Milliseconds to wait for more messages after the first arrives
+            max_batch: Maximum number of messages classified per request
+        """
+        self.ai = ai
+        self.prompts = prompts
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue[_QueueItem] = asyncio.Queue()
+        self._worker: asyncio.Task[None] | None = None
+        self._pending: set[asyncio.Task[None]] = set()
+        self.logger = logger.bind(service="semantic_router_batcher")
+
+    async def submit(self, message: str) -> SemanticRouterResponse:
+        """
+        Queue a message for classification and wait for its route.
+
+        Args:
+            message: User message to classify
+
+        Returns:
+            SemanticRouterResponse: Route determined for the message
+
+        Raises:
+            RoutingError: If the batched response cannot be matched to the inputs
+                or the message was classified with an unknown route
+        """
+        self._ensure_worker()
+        future: asyncio.Future[SemanticRouterResponse] = asyncio.get_running_loop().create_future()
+        await self._queue.put((message, future))
+        return await future
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._worker and not self._worker.done() and self._worker.get_loop() is loop:
+            return
+        # Start (or restart on a new event loop) with a fresh queue
+        self._queue = asyncio.Queue()
+        self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
+
+            # Dispatch without blocking collection of the next batch
+            task = loop.create_task(self._dispatch(batch))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _dispatch(self, batch: list[_QueueItem]) -> None:
+        try:
+            labels = await self._classify([message for message, _ in batch])
+        except Exception as e:
+            self.logger.exception("batch_routing_failed", size=len(batch), error=str(e))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), label in zip(batch, labels, strict=True):
+            if future.done():
+                continue
+            try:
+                future.set_result(_to_route(label))
+            except RoutingError as e:
+                future.set_exception(e)
+
+    async def _classify(self, messages: list[str]) -> list[str]:
+        if len(messages) == 1:
+            prompt, mime_type, schema = self.prompts.get_formatted_prompt(
+                "semantic_router", user_input=messages[0]
+            )
+            response = await self.ai.agenerate(
+                prompt=prompt, response_mime_type=mime_type, response_schema=schema
+            )
+            return [response.text]
+
+        prompt, mime_type, schema = self.prompts.get_formatted_prompt(
+            "semantic_router_batch", user_inputs=json.dumps(messages)
+        )
+        response = await self.ai.agenerate(
+            prompt=prompt, response_mime_type=mime_type, response_schema=schema
+        )
+        routes = json.loads(response.text).get("routes", [])
+        if len(routes) != len(messages):
+            msg = f"Expected {len(messages)} routes, got {len(routes)}"
+            raise RoutingError(msg)
+        self.logger.debug("batch_routed", size=len(messages))
+        return routes
+
+
+def _to_route(label: str) -> SemanticRouterResponse:
+    try:
+        return SemanticRouterResponse(label)
+    except ValueError as e:
+        msg = f"Unknown route: {label!r}"
+        raise RoutingError(msg) from e
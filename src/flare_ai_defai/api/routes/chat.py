@@ -11,15 +11,19 @@ The module provides a ChatRouter class that integrates various services:
 - Prompt management through PromptService
 """
 
-import json
+import asyncio
+import re
+import secrets
+from collections.abc import Awaitable, Callable
+from typing import Annotated
 
+import msgspec
 import structlog
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
-from web3 import Web3
-from web3.exceptions import Web3RPCError
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 
-from flare_ai_defai.ai import GeminiProvider
+from flare_ai_defai.ai import GeminiProvider, ResponseCache, safe_json_loads
+from flare_ai_defai.api.routes.batcher import SemanticRouterBatcher
 from flare_ai_defai.attestation import Vtpm, VtpmAttestationError
 from flare_ai_defai.blockchain import FlareProvider
 from flare_ai_defai.prompts import PromptService, SemanticRouterResponse
@@ -28,18 +32,53 @@ from flare_ai_defai.settings import settings
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
+# Cookie identifying clients that have not shared a wallet address
+SESSION_COOKIE = "session_id"
+_SESSION_ID = re.compile(r"[A-Za-z0-9_-]{22}")
 
-class ChatMessage(BaseModel):
+# Route handlers take (message, session_key), commands take (session_key)
+Handler = Callable[[str, str], Awaitable[dict[str, str]]]
+Command = Callable[[str], Awaitable[dict[str, str]]]
+
+
+class ChatMessage(msgspec.Struct, frozen=True):
     """
-    Pydantic model for chat message validation.
+    Chat message decoded from the request body.
 
     Attributes:
         message (str): The chat message content, must not be empty
         wallet_address (str, optional): The wallet address if connected
     """
 
-    message: str = Field(..., min_length=1)
-    wallet_address: str = Field(None)
+    message: str
+    wallet_address: str | None = None
+
+
+_chat_message_decoder = msgspec.json.Decoder(ChatMessage)
+# parse_msg reads the raw body, so FastAPI cannot infer the request body schema
+_chat_message_schema = msgspec.json.schema_components((ChatMessage,))[1]["ChatMessage"]
+
+
+async def parse_msg(request: Request) -> ChatMessage:
+    """
+    Decode and validate a chat message from the raw request body.
+
+    Args:
+        request: Incoming chat request
+
+    Returns:
+        ChatMessage: Decoded chat message
+
+    Raises:
+        HTTPException: With status 422 if the body is not a valid chat message
+    """
+    try:
+        message = _chat_message_decoder.decode(await request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    if not message.message:
+        raise HTTPException(status_code=422, detail="message must not be empty")
+    return message
 
 
 class ChatRouter:
@@ -55,6 +94,8 @@ class ChatRouter:
         blockchain (FlareProvider): Provider for blockchain operations
         attestation (Vtpm): Provider for attestation services
         prompts (PromptService): Service for managing prompts
+        cache (ResponseCache): Cache for repeated model responses
+        router_batcher (SemanticRouterBatcher): Micro-batcher for semantic routing
         logger (BoundLogger): Structured logger for the chat router
     """
 
@@ -64,6 +105,7 @@ class ChatRouter:
         blockchain: FlareProvider,
         attestation: Vtpm,
         prompts: PromptService,
+        cache: ResponseCache | None = None,
     ) -> None:
         """
         Initialize the ChatRouter with required service providers.
@@ -73,28 +115,60 @@ class ChatRouter:
             blockchain: Provider for blockchain operations
             attestation: Provider for attestation services
             prompts: Service for managing prompts
+            cache: Cache for repeated model responses, a default exact-match
+                cache is created if not provided
         """
         self._router = APIRouter()
         self.ai = ai
         self.blockchain = blockchain
         self.attestation = attestation
         self.prompts = prompts
+        self.cache = cache or ResponseCache()
+        self.router_batcher = SemanticRouterBatcher(
+            ai,
+            prompts,
+            window_ms=settings.router_batch_window_ms,
+            max_batch=settings.router_max_batch,
+        )
         self.logger = logger.bind(router="chat")
+        self._handlers: dict[SemanticRouterResponse, Handler] = {
+            SemanticRouterResponse.CONNECT_WALLET: self.handle_connect_wallet,
+            SemanticRouterResponse.SEND_TOKEN: self.handle_send_token,
+            SemanticRouterResponse.SWAP_TOKEN: self.handle_swap_token,
+            SemanticRouterResponse.REQUEST_ATTESTATION: self.handle_attestation,
+            SemanticRouterResponse.CONVERSATIONAL: self.handle_conversation,
+        }
+        self._commands: dict[str, Command] = {"/reset": self._reset}
         self._setup_routes()
 
-    def _setup_routes(self) -> None:  # noqa: C901
+    def _setup_routes(self) -> None:
         """
         Set up FastAPI routes for the chat endpoint.
         Handles message routing, command processing, and transaction confirmations.
         """
 
-        @self._router.post("/")
-        async def chat(message: ChatMessage) -> dict[str, str]:  # pyright: ignore [reportUnusedFunction]  # noqa: PLR0911
+        @self._router.post(
+            "/",
+            response_class=ORJSONResponse,
+            openapi_extra={
+                "requestBody": {
+                    "required": True,
+                    "content": {"application/json": {"schema": _chat_message_schema}},
+                }
+            },
+        )
+        async def chat(  # pyright: ignore [reportUnusedFunction]
+            message: Annotated[ChatMessage, Depends(parse_msg)],
+            request: Request,
+            response: Response,
+        ) -> dict[str, str]:
             """
             Process incoming chat messages and route them to appropriate handlers.
 
             Args:
                 message: Validated chat message
+                request: Incoming request, carrying the client's session cookie
+                response: Outgoing response, used to set the session cookie
 
             Returns:
                 dict[str, str]: Response containing handled message result
@@ -102,48 +176,28 @@ class ChatRouter:
             Raises:
                 HTTPException: If message handling fails
             """
+            session_key = self.session_key(message, self.client_id(request, response))
+
+            # Commands bypass session lookup and the rest of the pipeline
+            if message.message.startswith("/"):
+                return await self.handle_command(message.message, session_key)
+
             try:
                 self.logger.debug("received_message", message=message.message)
 
-                # Check if message is a command
-                if message.message.startswith("/"):
-                    return await self.handle_command(message.message)
-
                 # Connect wallet if address is provided
-                if message.wallet_address and not self.blockchain.address:
+                if message.wallet_address and not self.blockchain.get_session(session_key).address:
                     try:
-                        self.blockchain.connect_wallet(message.wallet_address)
+                        self.blockchain.connect_wallet(session_key, message.wallet_address)
                         self.logger.debug("wallet_connected", address=message.wallet_address)
                     except Exception as e:
                         self.logger.exception("wallet_connection_failed", error=str(e))
                         return {"response": f"Failed to connect wallet: {e!s}"}
+                session = self.blockchain.get_session(session_key)
 
                 # Handle transaction confirmation
-                if self.blockchain.tx_queue and message.message == self.blockchain.tx_queue[-1].msg:
-                    try:
-                        tx_data = self.blockchain.send_tx_in_queue()
-
-                        # Check if this is a transaction data response for wallet extension
-                        if tx_data.startswith("tx_data:"):
-                            # Return the transaction data for the wallet extension to handle
-                            return {"response": tx_data}
-
-                    except Web3RPCError as e:
-                        self.logger.exception("send_tx_failed", error=str(e))
-                        msg = f"Unfortunately the tx failed with the error:\n{e.args[0]}"
-                        return {"response": msg}
-
-                    prompt, mime_type, schema = self.prompts.get_formatted_prompt(
-                        "tx_confirmation",
-                        tx_hash=tx_data,
-                        block_explorer=settings.web3_explorer_url,
-                    )
-                    tx_confirmation_response = self.ai.generate(
-                        prompt=prompt,
-                        response_mime_type=mime_type,
-                        response_schema=schema,
-                    )
-                    return {"response": tx_confirmation_response.text}
+                if session.tx_queue and message.message == session.tx_queue[-1].msg:
+                    return await self.handle_tx_confirmation(session_key)
                 if self.attestation.attestation_requested:
                     try:
                         resp = self.attestation.get_token([message.message])
@@ -153,7 +207,7 @@ class ChatRouter:
                     return {"response": resp}
 
                 route = await self.get_semantic_route(message.message)
-                return await self.route_message(route, message.message)
+                return await self.route_message(route, message.message, session_key)
 
             except Exception as e:
                 self.logger.exception("message_handling_failed", error=str(e))
@@ -164,26 +218,101 @@ class ChatRouter:
         """Get the FastAPI router with registered routes."""
         return self._router
 
-    async def handle_command(self, command: str) -> dict[str, str]:
+    @staticmethod
+    def client_id(request: Request, response: Response) -> str:
+        """
+        Get the client's session id from its cookie, issuing one if missing.
+
+        Args:
+            request: Incoming chat request
+            response: Outgoing response the cookie is set on
+
+        Returns:
+            str: Random id identifying the client
+        """
+        client_id = request.cookies.get(SESSION_COOKIE)
+        if client_id is None or not _SESSION_ID.fullmatch(client_id):
+            client_id = secrets.token_urlsafe(16)
+            response.set_cookie(SESSION_COOKIE, client_id, httponly=True, samesite="strict")
+        return client_id
+
+    @staticmethod
+    def session_key(message: ChatMessage, client_id: str) -> str:
+        """
+        Derive the blockchain session key for a chat message.
+
+        Args:
+            message: Validated chat message
+            client_id: Id of the client that sent the message
+
+        Returns:
+            str: Lowercased wallet address, or a key derived from the client id
+                if the client has not shared one
+        """
+        if message.wallet_address:
+            return message.wallet_address.lower()
+        return f"client:{client_id}"
+
+    async def handle_command(self, command: str, session_key: str) -> dict[str, str]:
         """
         Handle special command messages starting with '/'.
 
         Args:
             command: Command string to process
+            session_key: Blockchain session of the sender
 
         Returns:
             dict[str, str]: Response containing command result
         """
-        if command == "/reset":
-            self.blockchain.reset()
-            self.ai.reset()
-            return {"response": "Reset complete"}
-        return {"response": "Unknown command"}
+        handler = self._commands.get(command.split(maxsplit=1)[0])
+        if not handler:
+            return {"response": "Unknown command"}
+        return await handler(session_key)
+
+    async def handle_tx_confirmation(self, session_key: str) -> dict[str, str]:
+        """
+        Send the most recent queued transaction of a session once confirmed.
+
+        Args:
+            session_key: Blockchain session of the sender
+
+        Returns:
+            dict[str, str]: Transaction data for the wallet extension, or a
+                confirmation message
+        """
+        session = self.blockchain.get_session(session_key)
+        async with session.lock:
+            tx_data = self.blockchain.send_tx_in_queue(session_key)
+
+        # Check if this is a transaction data response for wallet extension
+        if tx_data.startswith("tx_data:"):
+            # Return the transaction data for the wallet extension to handle
+            return {"response": tx_data}
+
+        prompt, mime_type, schema = self.prompts.get_formatted_prompt(
+            "tx_confirmation",
+            tx_hash=tx_data,
+            block_explorer=settings.web3_explorer_url,
+        )
+        tx_confirmation_response = await self.ai.agenerate(
+            prompt=prompt,
+            response_mime_type=mime_type,
+            response_schema=schema,
+        )
+        return {"response": tx_confirmation_response.text}
+
+    async def _reset(self, session_key: str) -> dict[str, str]:
+        self.blockchain.reset(session_key)
+        self.ai.reset()
+        return {"response": "Reset complete"}
 
     async def get_semantic_route(self, message: str) -> SemanticRouterResponse:
         """
         Determine the semantic route for a message using AI provider.
 
+        Cache misses are classified through the router batcher, which coalesces
+        concurrent messages into a single model request.
+
         Args:
             message: Message to route
 
@@ -191,184 +320,240 @@ class ChatRouter:
             SemanticRouterResponse: Determined route for the message
         """
         try:
-            prompt, mime_type, schema = self.prompts.get_formatted_prompt(
-                "semantic_router", user_input=message
+            route = await self._cached_response(
+                "semantic_router", message, lambda: self.router_batcher.submit(message)
             )
-            route_response = self.ai.generate(
-                prompt=prompt, response_mime_type=mime_type, response_schema=schema
-            )
-            return SemanticRouterResponse(route_response.text)
+            return SemanticRouterResponse(route)
         except Exception as e:
             self.logger.exception("routing_failed", error=str(e))
             return SemanticRouterResponse.CONVERSATIONAL
 
-    async def route_message(self, route: SemanticRouterResponse, message: str) -> dict[str, str]:
+    async def route_message(
+        self, route: SemanticRouterResponse, message: str, session_key: str
+    ) -> dict[str, str]:
         """
         Route a message to the appropriate handler based on semantic route.
 
         Args:
             route: Determined semantic route
             message: Original message to handle
+            session_key: Blockchain session of the sender
 
         Returns:
             dict[str, str]: Response from the appropriate handler
         """
-        handlers = {
-            SemanticRouterResponse.CONNECT_WALLET: self.handle_connect_wallet,
-            SemanticRouterResponse.SEND_TOKEN: self.handle_send_token,
-            SemanticRouterResponse.SWAP_TOKEN: self.handle_swap_token,
-            SemanticRouterResponse.REQUEST_ATTESTATION: self.handle_attestation,
-            SemanticRouterResponse.CONVERSATIONAL: self.handle_conversation,
-        }
-
-        handler = handlers.get(route)
+        handler = self._handlers.get(route)
         if not handler:
             return {"response": "Unsupported route"}
 
-        return await handler(message)
+        return await handler(message, session_key)
 
-    async def handle_connect_wallet(self, message: str) -> dict[str, str]:
+    async def handle_connect_wallet(self, message: str, session_key: str) -> dict[str, str]:
         """
         Handle wallet connection requests.
 
         Args:
             message: Message containing wallet address or connection request
+            session_key: Blockchain session of the sender
 
         Returns:
             dict[str, str]: Response containing wallet connection information
                 or existing wallet
         """
-        if self.blockchain.address:
-            return {"response": f"Wallet already connected - {self.blockchain.address}"}
+        address = self.blockchain.get_session(session_key).address
+        if address:
+            return {"response": f"Wallet already connected - {address}"}
 
-        # Extract wallet address from message or prompt user to connect wallet
+        # Extract wallet address and both candidate replies in a single request
         prompt, mime_type, schema = self.prompts.get_formatted_prompt(
-            "connect_wallet", user_input=message
+            "connect_wallet_combined", user_input=message
         )
-        wallet_response = self.ai.generate(
+        wallet_response = await self.ai.agenerate(
             prompt=prompt, response_mime_type=mime_type, response_schema=schema
         )
 
         try:
-            wallet_json = json.loads(wallet_response.text)
+            # Check both replies are present before connecting, so a missing one
+            # cannot leave a connected wallet behind the instructions fallback
+            wallet_json = safe_json_loads(
+                wallet_response.text,
+                ("wallet_address", "success_message", "instructions_message"),
+            )
             wallet_address = wallet_json.get("wallet_address")
 
             if wallet_address and wallet_address.startswith("0x"):
-                address = self.blockchain.connect_wallet(wallet_address)
-                prompt, mime_type, schema = self.prompts.get_formatted_prompt(
-                    "wallet_connected", address=address
-                )
-                wallet_connected_response = self.ai.generate(
-                    prompt=prompt, response_mime_type=mime_type, response_schema=schema
-                )
-                return {"response": wallet_connected_response.text}
+                self.blockchain.connect_wallet(session_key, wallet_address)
+                return {"response": wallet_json["success_message"]}
 
             # If no valid wallet address was found, return instructions for connecting wallet
-            prompt, mime_type, schema = self.prompts.get_formatted_prompt(
-                "wallet_connection_instructions"
-            )
-            instructions_response = self.ai.generate(
-                prompt=prompt, response_mime_type=mime_type, response_schema=schema
-            )
-            return {"response": instructions_response.text}  # noqa: TRY300
-        except (json.JSONDecodeError, ValueError):
+            return {"response": wallet_json["instructions_message"]}
+        except (KeyError, ValueError):
             # If there was an error parsing the response, return instructions for connecting wallet
             prompt, mime_type, schema = self.prompts.get_formatted_prompt(
                 "wallet_connection_instructions"
             )
-            instructions_response = self.ai.generate(
+            instructions_response = await self.ai.agenerate(
                 prompt=prompt, response_mime_type=mime_type, response_schema=schema
             )
             return {"response": instructions_response.text}
 
-    async def handle_send_token(self, message: str) -> dict[str, str]:
+    async def handle_send_token(self, message: str, session_key: str) -> dict[str, str]:
         """
         Handle token sending requests.
 
         Args:
             message: Message containing token sending details
+            session_key: Blockchain session of the sender
 
         Returns:
             dict[str, str]: Response containing transaction preview or follow-up prompt
         """
-        if not self.blockchain.address:
+        session = self.blockchain.get_session(session_key)
+        if not session.address:
             # Redirect to wallet connection if no wallet is connected
             prompt, mime_type, schema = self.prompts.get_formatted_prompt("wallet_required")
-            wallet_required_response = self.ai.generate(
+            wallet_required_response = await self.ai.agenerate(
                 prompt=prompt, response_mime_type=mime_type, response_schema=schema
             )
             return {"response": wallet_required_response.text}
 
+        # Fetch the transaction fields and request the follow-up speculatively
+        # alongside the extraction, the one not needed is discarded along with
+        # any error it raised
+        prefetch = asyncio.create_task(self.blockchain.prefetch_tx_fields(session_key))
         prompt, mime_type, schema = self.prompts.get_formatted_prompt(
             "token_send", user_input=message
         )
-        send_token_response = self.ai.generate(
-            prompt=prompt, response_mime_type=mime_type, response_schema=schema
-        )
-        send_token_json = json.loads(send_token_response.text)
-        expected_json_len = 2
-        if len(send_token_json) != expected_json_len or send_token_json.get("amount") == 0.0:
-            prompt, _, _ = self.prompts.get_formatted_prompt("follow_up_token_send")
-            follow_up_response = self.ai.generate(prompt)
+        follow_up_prompt, _, _ = self.prompts.get_formatted_prompt("follow_up_token_send")
+        try:
+            send_token_response, follow_up_response = await asyncio.gather(
+                self.ai.agenerate(
+                    prompt=prompt, response_mime_type=mime_type, response_schema=schema
+                ),
+                self.ai.agenerate(follow_up_prompt),
+                return_exceptions=True,
+            )
+        except BaseException:
+            prefetch.cancel()
+            raise
+        if isinstance(send_token_response, BaseException):
+            prefetch.cancel()
+            raise send_token_response
+        try:
+            send_token_json = safe_json_loads(send_token_response.text, ("to_address", "amount"))
+        except ValueError:
+            send_token_json = None
+        if send_token_json is None or send_token_json["amount"] == 0.0:
+            prefetch.cancel()
+            if isinstance(follow_up_response, BaseException):
+                raise follow_up_response
             return {"response": follow_up_response.text}
 
-        tx = self.blockchain.create_send_flr_tx(
-            to_address=send_token_json.get("to_address"),
-            amount=send_token_json.get("amount"),
-        )
-        self.logger.debug("send_token_tx", tx=tx)
-        self.blockchain.add_tx_to_queue(msg=message, tx=tx)
+        await prefetch
+        async with session.lock:
+            tx = await self.blockchain.create_send_flr_tx(
+                session_key,
+                to_address=send_token_json["to_address"],
+                amount=send_token_json["amount"],
+            )
+            self.logger.debug("send_token_tx", tx=tx)
+            self.blockchain.add_tx_to_queue(session_key, msg=message, tx=tx)
         formatted_preview = (
             "Transaction Preview: "
-            + f"Sending {Web3.from_wei(tx.get('value', 0), 'ether')} "
+            + f"Sending {send_token_json['amount']} "
             + f"FLR to {tx.get('to')}\nType CONFIRM to proceed."
         )
         return {"response": formatted_preview}
 
-    async def handle_swap_token(self, _: str) -> dict[str, str]:
+    async def handle_swap_token(self, _: str, session_key: str) -> dict[str, str]:
         """
         Handle token swap requests (currently unsupported).
 
         Args:
             _: Unused message parameter
+            session_key: Blockchain session of the sender
 
         Returns:
             dict[str, str]: Response indicating unsupported operation
         """
-        if not self.blockchain.address:
+        session = self.blockchain.get_session(session_key)
+        if not session.address:
             # Redirect to wallet connection if no wallet is connected
             prompt, mime_type, schema = self.prompts.get_formatted_prompt("wallet_required")
-            wallet_required_response = self.ai.generate(
+            wallet_required_response = await self.ai.agenerate(
                 prompt=prompt, response_mime_type=mime_type, response_schema=schema
             )
             return {"response": wallet_required_response.text}
 
         return {"response": "Sorry I can't do that right now"}
 
-    async def handle_attestation(self, _: str) -> dict[str, str]:
+    async def handle_attestation(self, _: str, __: str) -> dict[str, str]:
         """
         Handle attestation requests.
 
         Args:
             _: Unused message parameter
+            __: Unused session parameter
 
         Returns:
             dict[str, str]: Response containing attestation request
         """
         prompt = self.prompts.get_formatted_prompt("request_attestation")[0]
-        request_attestation_response = self.ai.generate(prompt=prompt)
+        request_attestation_response = await self.ai.agenerate(prompt=prompt)
         self.attestation.attestation_requested = True
         return {"response": request_attestation_response.text}
 
-    async def handle_conversation(self, message: str) -> dict[str, str]:
+    async def handle_conversation(self, message: str, _: str) -> dict[str, str]:
         """
         Handle general conversation messages.
 
         Args:
             message: Message to process
+            _: Unused session parameter
 
         Returns:
             dict[str, str]: Response from AI provider
         """
-        response = self.ai.send_message(message)
+        # Not cached, the reply depends on the chat history and the turn must
+        # enter it
+        response = await self.ai.asend_message(message)
         return {"response": response.text}
+
+    async def _cached_response(
+        self, kind: str, message: str, generate: Callable[[], Awaitable[str]]
+    ) -> str:
+        """
+        Return a cached response for the message, generating it on a miss.
+
+        The exact tier is checked first, so the message is only embedded for
+        the semantic tier when the exact lookup misses. Only use this for
+        stateless prompts whose response depends on the message alone.
+
+        Args:
+            kind: Prompt template name used as the cache namespace
+            message: User message the response is generated for
+            generate: Coroutine factory issuing the model request on a cache miss
+
+        Returns:
+            str: Cached or freshly generated response text
+        """
+        if not self.cache.is_cacheable(message):
+            return await generate()
+
+        embedding = None
+        if self.cache.semantic:
+            cached = self.cache.get_exact(kind, message)
+            if cached is not None:
+                return cached
+            try:
+                embedding = await self.ai.aembed(self.cache.normalize(message))
+            except Exception as e:
+                self.logger.exception("embedding_failed", error=str(e))
+
+        cached = self.cache.get(kind, message, embedding)
+        if cached is not None:
+            return cached
+
+        response = await generate()
+        self.cache.put(kind, message, response, embedding)
+        return response
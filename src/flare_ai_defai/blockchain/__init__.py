@@ -1,3 +1,4 @@
-from .flare import FlareProvider
+from .flare import FlareProvider, SessionState
+from .units import flr_to_wei, wei_to_flr
 
-__all__ = ["FlareProvider"]
+__all__ = ["FlareProvider", "SessionState", "flr_to_wei", "wei_to_flr"]
@@ -5,28 +5,27 @@ This module provides a FlareProvider class for interacting with the Flare Networ
 It handles wallet connection, transaction queuing, and blockchain interactions.
 """
 
-from dataclasses import dataclass
-
+import asyncio
+import functools
+import time
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, cast
+
+import msgspec
+import orjson
 import structlog
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from eth_typing import ChecksumAddress
-from web3 import Web3
-
-# Fix import for geth_poa_middleware
-try:
-    # For newer web3.py versions
-    from web3.middleware.geth import geth_poa_middleware  # type: ignore  # noqa: PGH003
-except ImportError:
-    # For older web3.py versions
-    try:
-        from web3.middleware import geth_poa_middleware
-    except ImportError:
-        # Fallback if middleware is not available
-        geth_poa_middleware = None
+from web3 import AsyncHTTPProvider, AsyncWeb3
 from web3.types import TxParams
 
+from flare_ai_defai.blockchain.units import flr_to_wei
 
-@dataclass
-class TxQueueElement:
+
+class TxQueueElement(msgspec.Struct):
     """
     Represents a transaction in the queue with its associated message.
 
@@ -39,19 +38,73 @@ class TxQueueElement:
     tx: TxParams
 
 
+# Upper bound on queued transactions, the oldest are dropped beyond this
+TX_QUEUE_MAXLEN = 256
+# Upper bound on stored sessions, the least recently used are evicted beyond this
+MAX_SESSIONS = 10_000
+# Gas fields are reused for about two Flare blocks before being refetched
+FEE_CACHE_TTL = 4.0
+# Gas limit of a plain FLR transfer
+TRANSFER_GAS = 21000
+# Seconds before an RPC request to the Web3 provider is abandoned
+RPC_TIMEOUT = 5.0
+# Keep-alive connection pool to the Web3 provider
+RPC_POOL_SIZE = 100
+RPC_KEEPALIVE_TIMEOUT = 60.0
+
+
+@dataclass
+class SessionState:
+    """
+    Wallet and transaction state of a single chat session.
+
+    Attributes:
+        address (ChecksumAddress | None): The connected wallet's checksum address
+        tx_queue (deque[TxQueueElement]): Bounded queue of pending transactions
+        nonce (int | None): Next nonce of the connected wallet, fetched from the
+            pending block on first use and advanced as transactions are sent
+        lock (asyncio.Lock): Serializes transaction queue updates within the session
+        tx_template (Mapping[str, Any] | None): Read-only transaction fields that
+            are fixed for the connected wallet, built on the first transaction
+    """
+
+    address: ChecksumAddress | None = None
+    tx_queue: deque[TxQueueElement] = field(default_factory=lambda: deque(maxlen=TX_QUEUE_MAXLEN))
+    nonce: int | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    tx_template: Mapping[str, Any] | None = None
+
+
 logger = structlog.get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def _checksum(address: str) -> ChecksumAddress:
+    # Users tend to send to and connect the same few addresses repeatedly
+    return AsyncWeb3.to_checksum_address(address)
+
+
 class FlareProvider:
     """
     Manages interactions with the Flare Network including wallet
     operations and transactions.
 
+    Wallet and transaction state is kept per session, so concurrent users can
+    connect wallets and queue transactions independently. Every stateful method
+    takes the `session_key` identifying the caller's session. A session is only
+    stored once a wallet is connected to it.
+
     Attributes:
-        address (ChecksumAddress | None): The connected wallet's checksum address
-        tx_queue (list[TxQueueElement]): Queue of pending transactions
-        w3 (Web3): Web3 instance for blockchain interactions
+        w3 (AsyncWeb3): Async Web3 instance for blockchain interactions
         logger (BoundLogger): Structured logger for the provider
+        _sessions (OrderedDict[str, SessionState]): Session state by session key,
+            in least recently used order
+        _chain_id (int | None): Memoized chain id, fetched on first use
+        _fee_cache (tuple[float, int, int] | None): Timestamp, gas price and max
+            priority fee of the last fee fetch
+        _provider (AsyncHTTPProvider): HTTP provider backing `w3`
+        _http_loop (asyncio.AbstractEventLoop | None): Event loop the pooled HTTP
+            session was created on
     """
 
     def __init__(self, web3_provider_url: str) -> None:
@@ -61,88 +114,145 @@ class FlareProvider:
         Args:
             web3_provider_url (str): URL of the Web3 provider endpoint
         """
-        self.address: ChecksumAddress | None = None
-        self.tx_queue: list[TxQueueElement] = []
-        self.w3 = Web3(Web3.HTTPProvider(web3_provider_url))
+        self._sessions: OrderedDict[str, SessionState] = OrderedDict()
+        self._provider = AsyncHTTPProvider(
+            web3_provider_url, request_kwargs={"timeout": ClientTimeout(total=RPC_TIMEOUT)}
+        )
+        self.w3 = AsyncWeb3(self._provider)
+        self._chain_id: int | None = None
+        self._fee_cache: tuple[float, int, int] | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
+        self.logger = logger.bind(router="flare_provider")
+
+    def get_session(self, session_key: str) -> SessionState:
+        """
+        Get the state of a session.
 
-        # Add POA middleware for Flare network if available
-        if geth_poa_middleware:
-            self.w3.middleware_onion.inject(geth_poa_middleware, layer=0)
+        Args:
+            session_key (str): Key identifying the session
 
-        self.logger = logger.bind(router="flare_provider")
+        Returns:
+            SessionState: Wallet and transaction state of the session, or a new
+                empty state that is not stored if no wallet was connected to it
+        """
+        session = self._sessions.get(session_key)
+        if session is None:
+            return SessionState()
+        self._sessions.move_to_end(session_key)
+        return session
 
-    def reset(self) -> None:
+    def reset(self, session_key: str) -> None:
         """
-        Reset the provider state by clearing wallet connection and transaction queue.
+        Reset a session by clearing its wallet connection and transaction queue.
+
+        Args:
+            session_key (str): Key identifying the session
         """
-        self.address = None
-        self.tx_queue = []
-        self.logger.debug("reset", address=self.address, tx_queue=self.tx_queue)
+        self._sessions.pop(session_key, None)
+        self.logger.debug("reset", session_key=session_key)
 
-    def add_tx_to_queue(self, msg: str, tx: TxParams) -> None:
+    def add_tx_to_queue(self, session_key: str, msg: str, tx: TxParams) -> None:
         """
-        Add a transaction to the queue with an associated message.
+        Add a transaction to a session's queue with an associated message.
 
         Args:
+            session_key (str): Key identifying the session
             msg (str): Description of the transaction
             tx (TxParams): Transaction parameters
         """
+        session = self.get_session(session_key)
         tx_queue_element = TxQueueElement(msg=msg, tx=tx)
-        self.tx_queue.append(tx_queue_element)
-        self.logger.debug("add_tx_to_queue", tx_queue=self.tx_queue)
+        session.tx_queue.append(tx_queue_element)
+        self.logger.debug("add_tx_to_queue", tx_queue=session.tx_queue)
 
-    def send_tx_in_queue(self) -> str:
+    def send_tx_in_queue(self, session_key: str) -> str:
         """
-        Send the most recent transaction in the queue.
+        Send the most recent transaction in a session's queue.
 
         For wallet extensions, this method returns the transaction data that should be
         sent to the wallet extension for signing and sending.
 
+        Args:
+            session_key (str): Key identifying the session
+
         Returns:
-            str: Transaction hash or transaction data for wallet extension
+            str: Transaction hash or transaction data for wallet extension, formatted
+                as `tx_data:` followed by a JSON object with `to`, `value_hex` and
+                `value_wei` keys
 
         Raises:
             ValueError: If no transaction is found in the queue
         """
-        if self.tx_queue:
-            tx_data = self.tx_queue[-1].tx
+        session = self.get_session(session_key)
+        tx_queue = session.tx_queue
+        if tx_queue:
+            tx_data = tx_queue[-1].tx
 
             # For wallet extensions, we need to return the transaction data
             # The actual transaction will be signed and sent by the wallet extension
             # in the frontend
 
-            # Format transaction for display - include hex value to preserve precision
-            to_address = tx_data["to"]
+            # Serialize for the wallet extension - include hex value to preserve
+            # precision, and wei as a string since it can exceed 64 bits
             value_wei = tx_data["value"]
-            value_hex = hex(value_wei)
-
-            tx_hash = f"tx_data:{to_address}:{value_hex}:{value_wei}"
+            tx_hash = (
+                b"tx_data:"
+                + orjson.dumps(
+                    {"to": tx_data["to"], "value_hex": hex(value_wei), "value_wei": str(value_wei)}
+                )
+            ).decode()
             self.logger.debug("prepared_tx_data", tx_data=tx_data)
 
-            # Remove the transaction from the queue
-            self.tx_queue.pop()
+            # Remove the transaction from the queue and advance past its nonce,
+            # previews that were never confirmed do not consume one. An older
+            # preview confirmed after a newer one must not move the nonce back.
+            tx_queue.pop()
+            if "nonce" in tx_data:
+                session.nonce = max(session.nonce or 0, tx_data["nonce"] + 1)
 
             return tx_hash
         msg = "Unable to find confirmed tx"
         raise ValueError(msg)
 
-    def connect_wallet(self, wallet_address: str) -> ChecksumAddress:
+    def connect_wallet(self, session_key: str, wallet_address: str) -> ChecksumAddress:
         """
-        Connect to a wallet using its address.
+        Connect a session to a wallet using its address.
 
         Args:
+            session_key (str): Key identifying the session
             wallet_address (str): The wallet address to connect to
 
         Returns:
             ChecksumAddress: The checksum address of the connected wallet
-        """
-        self.address = self.w3.to_checksum_address(wallet_address)
-        self.logger.debug("connect_wallet", address=self.address)
-        return self.address
 
-    def check_balance(self) -> float:
+        Raises:
+            ValueError: If the wallet address is not a valid address
+        """
+        address = _checksum(wallet_address)
+        session = self._sessions.get(session_key)
+        if session is None:
+            session = self._sessions[session_key] = SessionState()
+            if len(self._sessions) > MAX_SESSIONS:
+                self._sessions.popitem(last=False)
+        self._sessions.move_to_end(session_key)
+        if address != session.address:
+            session.address = address
+            session.nonce = None
+            session.tx_template = None
+        self.logger.debug("connect_wallet", session_key=session_key, address=address)
+        return address
+
+    async def close(self) -> None:
+        """Close the pooled HTTP sessions to the Web3 provider."""
+        await self._provider.disconnect()
+        self._http_loop = None
+
+    async def check_balance(self, session_key: str) -> float:
         """
-        Check the balance of the current wallet.
+        Check the balance of a session's wallet.
+
+        Args:
+            session_key (str): Key identifying the session
 
         Returns:
             float: Wallet balance in FLR
@@ -150,18 +260,23 @@ class FlareProvider:
         Raises:
             ValueError: If wallet is not connected
         """
-        if not self.address:
+        address = self.get_session(session_key).address
+        if not address:
             msg = "Wallet not connected"
             raise ValueError(msg)
-        balance_wei = self.w3.eth.get_balance(self.address)
+        await self._ensure_http_session()
+        balance_wei = await self.w3.eth.get_balance(address)
         self.logger.debug("check_balance", balance_wei=balance_wei)
         return float(self.w3.from_wei(balance_wei, "ether"))
 
-    def create_send_flr_tx(self, to_address: str, amount: float) -> TxParams:
+    async def create_send_flr_tx(
+        self, session_key: str, to_address: str, amount: float
+    ) -> TxParams:
         """
-        Create a transaction to send FLR tokens.
+        Create a transaction to send FLR tokens from a session's wallet.
 
         Args:
+            session_key (str): Key identifying the session
             to_address (str): Recipient address
             amount (float): Amount of FLR to send
 
@@ -171,18 +286,95 @@ class FlareProvider:
         Raises:
             ValueError: If wallet is not connected
         """
-        if not self.address:
+        session = self.get_session(session_key)
+        if not session.address:
             msg = "Wallet not connected"
             raise ValueError(msg)
-        tx: TxParams = {
-            "from": self.address,
-            "nonce": self.w3.eth.get_transaction_count(self.address),
-            "to": self.w3.to_checksum_address(to_address),
-            "value": self.w3.to_wei(amount, unit="ether"),
-            "gas": 21000,
-            "maxFeePerGas": self.w3.eth.gas_price,
-            "maxPriorityFeePerGas": self.w3.eth.max_priority_fee,
-            "chainId": self.w3.eth.chain_id,
-            "type": 2,
-        }
-        return tx
+        nonce, gas_price, max_priority_fee, chain_id = await self._fetch_tx_fields(
+            session.address, session
+        )
+        template = session.tx_template
+        if template is None:
+            template = session.tx_template = MappingProxyType(
+                {"from": session.address, "gas": TRANSFER_GAS, "chainId": chain_id, "type": 2}
+            )
+        return cast(
+            "TxParams",
+            {
+                **template,
+                "nonce": nonce,
+                "to": _checksum(to_address),
+                "value": flr_to_wei(amount),
+                "maxFeePerGas": gas_price,
+                "maxPriorityFeePerGas": max_priority_fee,
+            },
+        )
+
+    async def prefetch_tx_fields(self, session_key: str) -> None:
+        """
+        Warm the nonce, fee and chain id caches for a session's next transaction.
+
+        Intended to run concurrently with work that precedes
+        `create_send_flr_tx`, so its RPC round-trip is off the critical path.
+        This is best effort: failures are logged and `create_send_flr_tx`
+        fetches whatever is still missing.
+
+        Args:
+            session_key (str): Key identifying the session
+        """
+        session = self.get_session(session_key)
+        if not session.address:
+            return
+        try:
+            await self._fetch_tx_fields(session.address, session)
+        except Exception as e:
+            self.logger.exception("prefetch_tx_fields_failed", error=str(e))
+
+    async def _fetch_tx_fields(
+        self, address: ChecksumAddress, session: SessionState
+    ) -> tuple[int, int, int, int]:
+        # Fetch whichever of nonce, fees and chain id are not cached in a single
+        # JSON-RPC batch rather than one round-trip each
+        nonce, chain_id, fees = session.nonce, self._chain_id, self._fee_cache
+        if fees is not None and time.monotonic() - fees[0] >= FEE_CACHE_TTL:
+            fees = None
+
+        if nonce is None or chain_id is None or fees is None:
+            await self._ensure_http_session()
+            async with self.w3.batch_requests() as batch:
+                if nonce is None:
+                    batch.add(self.w3.eth.get_transaction_count(address, "pending"))
+                if fees is None:
+                    batch.add(self.w3.eth.gas_price)
+                    batch.add(self.w3.eth.max_priority_fee)
+                if chain_id is None:
+                    batch.add(self.w3.eth.chain_id)
+                # Every batched call returns an integer quantity
+                results = iter(cast("list[int]", await batch.async_execute()))
+
+            if nonce is None:
+                fetched_nonce = next(results)
+                # Keep a nonce another request advanced while this one was in flight
+                if session.nonce is None:
+                    session.nonce = fetched_nonce
+                nonce = session.nonce
+            if fees is None:
+                fees = self._fee_cache = (time.monotonic(), next(results), next(results))
+            if chain_id is None:
+                chain_id = self._chain_id = next(results)
+        return nonce, fees[1], fees[2], chain_id
+
+    async def _ensure_http_session(self) -> None:
+        # aiohttp sessions are bound to an event loop, so a pooled session is
+        # registered with the provider whenever the running loop changes
+        loop = asyncio.get_running_loop()
+        if self._http_loop is loop:
+            return
+        session = ClientSession(
+            connector=TCPConnector(limit=RPC_POOL_SIZE, keepalive_timeout=RPC_KEEPALIVE_TIMEOUT),
+            raise_for_status=True,
+        )
+        if await self._provider.cache_async_session(session) is not session:
+            # The provider already holds a session for this loop
+            await session.close()
+        self._http_loop = loop
@@ -0,0 +1,53 @@
+"""
+Unit Conversion Module
+
+This module provides fast FLR <-> wei conversions for the transaction preview
+and creation paths. `Web3.to_wei`/`from_wei` go through `Decimal` arithmetic
+with a 999-digit context on every call; the helpers here work on the float's
+shortest decimal representation with plain integer arithmetic instead, and
+fall back to `Web3.to_wei` for inputs outside the fast path (exponent
+notation, more than 18 decimals, negative or non-finite values).
+
+Results are identical to `Web3.to_wei(amount, "ether")`.
+"""
+
+from web3 import Web3
+
+WEI_PER_FLR = 10**18
+_FLR_DECIMALS = 18
+
+
+def flr_to_wei(amount: float) -> int:
+    """
+    Convert an FLR amount to wei.
+
+    Args:
+        amount (float): Amount of FLR
+
+    Returns:
+        int: Amount in wei
+
+    Raises:
+        ValueError: If the amount is negative or otherwise not a valid wei value
+    """
+    if isinstance(amount, int) and amount >= 0:
+        return amount * WEI_PER_FLR
+
+    # repr() gives the shortest string that round-trips, matching Decimal(str(x))
+    whole, _, fraction = repr(amount).partition(".")
+    if whole.isdigit() and fraction.isdigit() and len(fraction) <= _FLR_DECIMALS:
+        return int(whole) * WEI_PER_FLR + int(fraction.ljust(_FLR_DECIMALS, "0"))
+    return Web3.to_wei(amount, "ether")
+
+
+def wei_to_flr(value_wei: int) -> float:
+    """
+    Convert a wei amount to FLR.
+
+    Args:
+        value_wei (int): Amount in wei
+
+    Returns:
+        float: Amount of FLR, correctly rounded to the nearest float
+    """
+    return value_wei / WEI_PER_FLR
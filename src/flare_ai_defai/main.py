@@ -12,6 +12,9 @@ Dependencies:
     - Custom providers for AI, blockchain, and attestation services
 """
 
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -21,6 +24,7 @@ from flare_ai_defai import (
     FlareProvider,
     GeminiProvider,
     PromptService,
+    ResponseCache,
     Vtpm,
 )
 from flare_ai_defai.settings import settings
@@ -40,6 +44,7 @@ def create_app() -> FastAPI:
        - FlareProvider for blockchain interactions
        - Vtpm for attestation services
        - PromptService for managing chat prompts
+       - ResponseCache for reusing repeated model responses
     4. Sets up routing for chat endpoints
 
     Returns:
@@ -51,10 +56,27 @@ def create_app() -> FastAPI:
         - cors_origins: List of allowed CORS origins
         - gemini_api_key: API key for Gemini AI service
         - gemini_model: Model identifier for Gemini AI
+        - gemini_max_concurrency: Cap on concurrent Gemini requests
+        - gemini_embedding_model: Embedding model for the semantic cache
+        - response_cache_size / response_cache_ttl: Response cache limits
+        - semantic_cache_enabled / semantic_cache_threshold: Semantic cache tier
         - web3_provider_url: URL for Web3 provider
         - simulate_attestation: Boolean flag for attestation simulation
     """
-    app = FastAPI(title="AI Agent API", version=settings.api_version, redirect_slashes=False)
+    blockchain = FlareProvider(web3_provider_url=settings.web3_provider_url)
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncGenerator[None]:
+        yield
+        # Release pooled connections to the Web3 provider on shutdown
+        await blockchain.close()
+
+    app = FastAPI(
+        title="AI Agent API",
+        version=settings.api_version,
+        redirect_slashes=False,
+        lifespan=lifespan,
+    )
 
     # Configure CORS middleware with settings from configuration
     app.add_middleware(
@@ -67,10 +89,21 @@ def create_app() -> FastAPI:
 
     # Initialize router with service providers
     chat = ChatRouter(
-        ai=GeminiProvider(api_key=settings.gemini_api_key, model=settings.gemini_model),
-        blockchain=FlareProvider(web3_provider_url=settings.web3_provider_url),
+        ai=GeminiProvider(
+            api_key=settings.gemini_api_key,
+            model=settings.gemini_model,
+            max_concurrency=settings.gemini_max_concurrency,
+            embedding_model=settings.gemini_embedding_model,
+        ),
+        blockchain=blockchain,
         attestation=Vtpm(simulate=settings.simulate_attestation),
         prompts=PromptService(),
+        cache=ResponseCache(
+            max_size=settings.response_cache_size,
+            ttl=settings.response_cache_ttl,
+            similarity_threshold=settings.semantic_cache_threshold,
+            semantic=settings.semantic_cache_enabled,
+        ),
     )
 
     # Register chat routes with API
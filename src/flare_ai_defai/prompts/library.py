@@ -12,27 +12,35 @@ Prompts are categorized for easy management and retrieval.
 
 Example:
     ```python
-    library = PromptLibrary()
+    library = PromptLibrary.default()
     token_send_prompt = library.get_prompt("token_send")
     account_prompts = library.get_prompts_by_category("account")
     ```
 """
 
+import functools
+import logging
+from collections.abc import Mapping
+
 import structlog
 
 from flare_ai_defai.prompts.schemas import (
     Prompt,
+    SemanticRouterBatchResponse,
     SemanticRouterResponse,
     TokenSendResponse,
     TokenSwapResponse,
+    WalletConnectCombinedResponse,
     WalletConnectResponse,
 )
 from flare_ai_defai.prompts.templates import (
     CONNECT_WALLET,
+    CONNECT_WALLET_COMBINED,
     CONVERSATIONAL,
     GENERATE_ACCOUNT,
     REMOTE_ATTESTATION,
     SEMANTIC_ROUTER,
+    SEMANTIC_ROUTER_BATCH,
     TOKEN_SEND,
     TOKEN_SWAP,
     TX_CONFIRMATION,
@@ -43,6 +51,138 @@ from flare_ai_defai.prompts.templates import (
 
 logger = structlog.get_logger(__name__)
 
+_DEFAULT_PROMPTS: tuple[Prompt, ...] = (
+    Prompt(
+        name="semantic_router",
+        description="Route user query based on user input",
+        template=SEMANTIC_ROUTER,
+        required_inputs=["user_input"],
+        response_mime_type="text/x.enum",
+        response_schema=SemanticRouterResponse,
+        category="router",
+    ),
+    Prompt(
+        name="semantic_router_batch",
+        description="Route several user queries based on user inputs",
+        template=SEMANTIC_ROUTER_BATCH,
+        required_inputs=["user_inputs"],
+        response_mime_type="application/json",
+        response_schema=SemanticRouterBatchResponse,
+        category="router",
+    ),
+    Prompt(
+        name="token_send",
+        description="Extract token send parameters from user input",
+        template=TOKEN_SEND,
+        required_inputs=["user_input"],
+        response_mime_type="application/json",
+        response_schema=TokenSendResponse,
+        category="defai",
+    ),
+    Prompt(
+        name="token_swap",
+        description="Extract token swap parameters from user input",
+        template=TOKEN_SWAP,
+        required_inputs=["user_input"],
+        response_schema=TokenSwapResponse,
+        response_mime_type="application/json",
+        category="defai",
+    ),
+    Prompt(
+        name="connect_wallet",
+        description="Extract wallet address from user input",
+        template=CONNECT_WALLET,
+        required_inputs=["user_input"],
+        response_schema=WalletConnectResponse,
+        response_mime_type="application/json",
+        category="wallet",
+    ),
+    Prompt(
+        name="connect_wallet_combined",
+        description="Extract wallet address and generate both connection replies",
+        template=CONNECT_WALLET_COMBINED,
+        required_inputs=["user_input"],
+        response_schema=WalletConnectCombinedResponse,
+        response_mime_type="application/json",
+        category="wallet",
+    ),
+    Prompt(
+        name="wallet_connected",
+        description="Generate response for successful wallet connection",
+        template=WALLET_CONNECTED,
+        required_inputs=["address"],
+        response_schema=None,
+        response_mime_type="text/plain",
+        category="wallet",
+    ),
+    Prompt(
+        name="wallet_connection_instructions",
+        description="Generate instructions for connecting a wallet",
+        template=WALLET_CONNECTION_INSTRUCTIONS,
+        required_inputs=[],
+        response_schema=None,
+        response_mime_type="text/plain",
+        category="wallet",
+    ),
+    Prompt(
+        name="wallet_required",
+        description="Generate message explaining wallet requirement",
+        template=WALLET_REQUIRED,
+        required_inputs=[],
+        response_schema=None,
+        response_mime_type="text/plain",
+        category="wallet",
+    ),
+    Prompt(
+        name="generate_account",
+        description="Generate response for account creation",
+        template=GENERATE_ACCOUNT,
+        required_inputs=["address"],
+        response_schema=None,
+        response_mime_type="text/plain",
+        category="account",
+    ),
+    Prompt(
+        name="request_attestation",
+        description="Generate attestation request",
+        template=REMOTE_ATTESTATION,
+        required_inputs=[],
+        response_schema=None,
+        response_mime_type="text/plain",
+        category="attestation",
+    ),
+    Prompt(
+        name="tx_confirmation",
+        description="Generate transaction confirmation",
+        template=TX_CONFIRMATION,
+        required_inputs=["tx_hash", "block_explorer"],
+        response_schema=None,
+        response_mime_type="text/plain",
+        category="defai",
+    ),
+    Prompt(
+        name="follow_up_token_send",
+        description="Generate follow-up for token send",
+        template=(
+            "I need more information to process your token transfer. "
+            "Please specify the recipient address and the amount you want to send."
+        ),
+        required_inputs=[],
+        response_schema=None,
+        response_mime_type="text/plain",
+        category="defai",
+    ),
+    Prompt(
+        name="conversational",
+        description="Generate conversational response",
+        template=CONVERSATIONAL,
+        required_inputs=["user_input"],
+        response_schema=None,
+        response_mime_type="text/plain",
+        category="conversation",
+    ),
+)
+
 
 class PromptLibrary:
     """
@@ -52,21 +192,50 @@ class PromptLibrary:
     in the application. It allows for easy retrieval of prompts by name or category,
     and ensures consistent prompt formatting across the application.
 
+    Use `PromptLibrary.default()` to share one library of the default prompts.
+    `add_prompt` on that shared instance changes it for every caller, so code
+    that needs its own modifications should construct a `PromptLibrary()`.
+
     Attributes:
         prompts (dict[str, Prompt]): Dictionary of prompt templates indexed by name
         logger (BoundLogger): Structured logger for the prompt library
+        _by_category (dict[str | None, list[Prompt]]): Prompts indexed by category
+        _categories_cache (list[str] | None): Category names, rebuilt after the
+            library changes
     """
 
-    def __init__(self) -> None:
+    def __init__(self, prompts: Mapping[str, Prompt] | None = None) -> None:
         """
-        Initialize the prompt library with default prompts.
+        Initialize the prompt library.
+
+        Creates a new PromptLibrary instance and populates it with the given
+        prompts, or with a set of default prompt templates for various
+        operations if none are given.
 
-        Creates a new PromptLibrary instance and populates it with a set of
-        default prompt templates for various operations.
+        Args:
+            prompts: Prompts to populate the library with, indexed by name
         """
         self.prompts: dict[str, Prompt] = {}
+        self._by_category: dict[str | None, list[Prompt]] = {}
+        self._categories_cache: list[str] | None = None
         self.logger = logger.bind(module="prompt_library")
-        self._initialize_default_prompts()
+        if prompts is None:
+            self._initialize_default_prompts()
+        else:
+            for prompt in prompts.values():
+                self._register(prompt)
+
+    @classmethod
+    def default(cls) -> "PromptLibrary":
+        """
+        Get the shared library of default prompts.
+
+        The library is built on first use and reused afterwards.
+
+        Returns:
+            PromptLibrary: Shared library populated with the default prompts
+        """
+        return _default_library()
 
     def get_prompt(self, name: str) -> Prompt:
         """
@@ -81,10 +250,11 @@ class PromptLibrary:
         Raises:
             KeyError: If the prompt name is not found in the library
         """
-        if name not in self.prompts:
+        prompt = self.prompts.get(name)
+        if prompt is None:
             msg = f"Prompt '{name}' not found"
             raise KeyError(msg)
-        return self.prompts[name]
+        return prompt
 
     def get_prompts_by_category(self, category: str) -> list[Prompt]:
         """
@@ -96,140 +266,28 @@ class PromptLibrary:
         Returns:
             list[Prompt]: List of prompts in the specified category
         """
-        return [p for p in self.prompts.values() if p.category == category]
+        return list(self._by_category.get(category, ()))
 
     def _initialize_default_prompts(self) -> None:
         """
-        Initialize the library with a set of default prompts.
+        Initialize the library with the module's default prompts.
 
-        Creates and adds the following default prompts:
+        The prompts are built once at import time and shared between
+        libraries. They include:
         - semantic_router: For routing user queries
+        - semantic_router_batch: For routing several user queries in one request
         - token_send: For token transfer operations
         - token_swap: For token swap operations
         - connect_wallet: For wallet connection
+        - connect_wallet_combined: For wallet connection with both replies in one request
         - conversational: For general user interactions
         - request_attestation: For remote attestation requests
         - tx_confirmation: For transaction confirmation
 
         This method is called automatically during instance initialization.
         """
-        default_prompts = [
-            Prompt(
-                name="semantic_router",
-                description="Route user query based on user input",
-                template=SEMANTIC_ROUTER,
-                required_inputs=["user_input"],
-                response_mime_type="text/x.enum",
-                response_schema=SemanticRouterResponse,
-                category="router",
-            ),
-            Prompt(
-                name="token_send",
-                description="Extract token send parameters from user input",
-                template=TOKEN_SEND,
-                required_inputs=["user_input"],
-                response_mime_type="application/json",
-                response_schema=TokenSendResponse,
-                category="defai",
-            ),
-            Prompt(
-                name="token_swap",
-                description="Extract token swap parameters from user input",
-                template=TOKEN_SWAP,
-                required_inputs=["user_input"],
-                response_schema=TokenSwapResponse,
-                response_mime_type="application/json",
-                category="defai",
-            ),
-            Prompt(
-                name="connect_wallet",
-                description="Extract wallet address from user input",
-                template=CONNECT_WALLET,
-                required_inputs=["user_input"],
-                response_schema=WalletConnectResponse,
-                response_mime_type="application/json",
-                category="wallet",
-            ),
-            Prompt(
-                name="wallet_connected",
-                description="Generate response for successful wallet connection",
-                template=WALLET_CONNECTED,
-                required_inputs=["address"],
-                response_schema=None,
-                response_mime_type="text/plain",
-                category="wallet",
-            ),
-            Prompt(
-                name="wallet_connection_instructions",
-                description="Generate instructions for connecting a wallet",
-                template=WALLET_CONNECTION_INSTRUCTIONS,
-                required_inputs=[],
-                response_schema=None,
-                response_mime_type="text/plain",
-                category="wallet",
-            ),
-            Prompt(
-                name="wallet_required",
-                description="Generate message explaining wallet requirement",
-                template=WALLET_REQUIRED,
-                required_inputs=[],
-                response_schema=None,
-                response_mime_type="text/plain",
-                category="wallet",
-            ),
-            Prompt(
-                name="generate_account",
-                description="Generate response for account creation",
-                template=GENERATE_ACCOUNT,
-                required_inputs=["address"],
-                response_schema=None,
-                response_mime_type="text/plain",
-                category="account",
-            ),
-            Prompt(
-                name="request_attestation",
-                description="Generate attestation request",
-                template=REMOTE_ATTESTATION,
-                required_inputs=[],
-                response_schema=None,
-                response_mime_type="text/plain",
-                category="attestation",
-            ),
-            Prompt(
-                name="tx_confirmation",
-                description="Generate transaction confirmation",
-                template=TX_CONFIRMATION,
-                required_inputs=["tx_hash", "block_explorer"],
-                response_schema=None,
-                response_mime_type="text/plain",
-                category="defai",
-            ),
-            Prompt(
-                name="follow_up_token_send",
-                description="Generate follow-up for token send",
-                template=(
-                    "I need more information to process your token transfer. "
-                    "Please specify the recipient address and the amount you want to send."
-                ),
-                required_inputs=[],
-                response_schema=None,
-                response_mime_type="text/plain",
-                category="defai",
-            ),
-            Prompt(
-                name="conversational",
-                description="Generate conversational response",
-                template=CONVERSATIONAL,
-                required_inputs=["user_input"],
-                response_schema=None,
-                response_mime_type="text/plain",
-                category="conversation",
-            ),
-        ]
-
-        for prompt in default_prompts:
-            self.prompts[prompt.name] = prompt
-            self.logger.debug("added_prompt", name=prompt.name, category=prompt.category)
+        for prompt in _DEFAULT_PROMPTS:
+            self._register(prompt)
 
     def add_prompt(self, prompt: Prompt) -> None:
         """
@@ -247,8 +305,10 @@ class PromptLibrary:
             library.add_prompt(custom_prompt)
             ```
         """
-        self.prompts[prompt.name] = prompt
-        logger.debug("prompt_added", name=prompt.name, category=prompt.category)
+        self._register(prompt)
+        # Skip building the event when debug logging is filtered out
+        if self.logger.is_enabled_for(logging.DEBUG):
+            self.logger.debug("prompt_added", name=prompt.name, category=prompt.category)
 
     def list_categories(self) -> list[str]:
         """
@@ -263,6 +323,33 @@ class PromptLibrary:
             print("Available categories:", categories)
             ```
         """
-        return list(
-            {prompt.category for prompt in self.prompts.values() if prompt.category is not None}
-        )
+        if self._categories_cache is None:
+            self._categories_cache = [
+                category for category in self._by_category if category is not None
+            ]
+        return list(self._categories_cache)
+
+    def _register(self, prompt: Prompt) -> None:
+        """
+        Store a prompt by name and index it by category.
+
+        A prompt replacing an existing one with the same name is also removed
+        from its previous category.
+
+        Args:
+            prompt (Prompt): The prompt to store
+        """
+        previous = self.prompts.get(prompt.name)
+        if previous is not None:
+            siblings = self._by_category[previous.category]
+            siblings.remove(previous)
+            if not siblings:
+                del self._by_category[previous.category]
+        self.prompts[prompt.name] = prompt
+        self._by_category.setdefault(prompt.category, []).append(prompt)
+        self._categories_cache = None
+
+
+@functools.lru_cache(maxsize=1)
+def _default_library() -> PromptLibrary:
+    return PromptLibrary()
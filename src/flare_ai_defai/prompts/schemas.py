@@ -40,6 +40,17 @@ class SemanticRouterResponse(str, Enum):
     CONVERSATIONAL = "Conversational"
 
 
+class SemanticRouterBatchResponse(TypedDict):
+    """
+    Type definition for a batched semantic routing response.
+
+    Attributes:
+        routes (list[SemanticRouterResponse]): One route per input, in input order
+    """
+
+    routes: list[SemanticRouterResponse]
+
+
 class TokenSendResponse(TypedDict):
     """
     Type definition for token send operation parameters.
@@ -70,6 +81,24 @@ class WalletConnectResponse(TypedDict):
     wallet_address: str
 
 
+class WalletConnectCombinedResponse(TypedDict):
+    """
+    Type definition for a combined wallet connection response.
+
+    This type bundles the extracted wallet address with both candidate replies,
+    so the caller can pick one locally without a second model request.
+
+    Attributes:
+        wallet_address (str): Wallet address to connect to, empty if none found
+        success_message (str): Reply to send if the wallet was connected
+        instructions_message (str): Reply to send if no wallet address was found
+    """
+
+    wallet_address: str
+    success_message: str
+    instructions_message: str
+
+
 class TokenSwapResponse(TypedDict):
     """
     Type definition for token swap operation parameters.
@@ -108,7 +137,7 @@ class PromptInputs(TypedDict, total=False):
     code: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Prompt:
     """
     A dataclass representing an AI prompt template with its metadata
@@ -116,6 +145,8 @@ class Prompt:
 
     This class encapsulates all information needed to define and use an AI prompt,
     including its template text, required inputs, response handling, and metadata.
+    Instances are immutable and slotted, since the default prompts are shared
+    between libraries.
 
     Attributes:
         name (str): Unique identifier for the prompt
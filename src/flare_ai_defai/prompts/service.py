@@ -21,9 +21,14 @@ from typing import Any
 import structlog
 
 from flare_ai_defai.prompts.library import PromptLibrary
+from flare_ai_defai.prompts.schemas import Prompt
 
 logger = structlog.get_logger(__name__)
 
+FormattedPrompt = tuple[str, str | None, type | None]
+# A formatted prompt cached along with the prompt it was formatted from
+_StaticPrompt = tuple[Prompt, FormattedPrompt]
+
 
 class PromptService:
     """
@@ -40,6 +45,9 @@ class PromptService:
         library (PromptLibrary): Instance of the prompt library containing all
             prompt templates
         logger (BoundLogger): Structured logger bound with service context
+        _static_prompts (dict[str, _StaticPrompt]): Formatted
+            prompts without inputs by name, along with the prompt they were
+            formatted from
 
     Example:
         ```python
@@ -53,25 +61,29 @@ class PromptService:
         ```
     """
 
-    def __init__(self) -> None:
+    def __init__(self, library: PromptLibrary | None = None) -> None:
         """
         Initialize a new PromptService instance.
 
-        Creates a new PromptLibrary instance and initializes a bound logger
-        with the service context.
+        Uses the given PromptLibrary, or the shared default library, and
+        initializes a bound logger with the service context.
+
+        Args:
+            library: Prompt library to format prompts from, defaults to
+                `PromptLibrary.default()`
         """
-        self.library = PromptLibrary()
+        self.library = library or PromptLibrary.default()
         self.logger = logger.bind(service="prompt")
+        self._static_prompts: dict[str, _StaticPrompt] = {}
 
-    def get_formatted_prompt(
-        self, prompt_name: str, **kwargs: Any
-    ) -> tuple[str, str | None, type | None]:
+    def get_formatted_prompt(self, prompt_name: str, **kwargs: Any) -> FormattedPrompt:
         """
         Get a formatted prompt with its schema and mime type.
 
         Retrieves a prompt template by name, formats it with the provided
         parameters, and returns the formatted prompt along with its
-        associated metadata.
+        associated metadata. Prompts without inputs are formatted once and
+        returned from a cache afterwards, until the library replaces them.
 
         Args:
             prompt_name (str): Name of the prompt template to retrieve
@@ -107,9 +119,15 @@ class PromptService:
         """
         try:
             prompt = self.library.get_prompt(prompt_name)
+            cached = self._static_prompts.get(prompt_name)
+            if cached is not None and cached[0] is prompt:
+                return cached[1]
             formatted = prompt.format(**kwargs)
         except Exception as e:
             self.logger.exception("prompt_formatting_failed", prompt_name=prompt_name, error=str(e))
             raise
-        else:
-            return (formatted, prompt.response_mime_type, prompt.response_schema)
+
+        result = (formatted, prompt.response_mime_type, prompt.response_schema)
+        if not prompt.required_inputs:
+            self._static_prompts[prompt_name] = (prompt, result)
+        return result
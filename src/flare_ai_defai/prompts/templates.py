@@ -1,9 +1,6 @@
 from typing import Final
 
-SEMANTIC_ROUTER: Final = """
-Classify the following user input into EXACTLY ONE category. Analyze carefully and choose the most specific matching category.
-
-Categories (in order of precedence):
+_ROUTER_CATEGORIES: Final = """Categories (in order of precedence):
 1. CONNECT_WALLET
    • Keywords: connect wallet, link wallet, use wallet, wallet extension
    • Must express intent to connect/link an existing wallet or use a wallet extension
@@ -29,21 +26,46 @@ Categories (in order of precedence):
    • General questions, greetings, or unclear requests
    • Any ambiguous or multi-category inputs
 
-Input: ${user_input}
+"""
 
-Instructions:
+SEMANTIC_ROUTER: Final = (
+    """
+Classify the following user input into EXACTLY ONE category. Analyze carefully and choose the most specific matching category.
+
+"""
+    + _ROUTER_CATEGORIES
+    + """Instructions:
 - Choose ONE category only
 - Select most specific matching category
 - Default to CONVERSATIONAL if unclear
 - Ignore politeness phrases or extra context
 - Focus on core intent of request
+
+Input: ${user_input}
 """
+)
+
+SEMANTIC_ROUTER_BATCH: Final = (
+    """
+Classify EACH of the following user inputs independently into EXACTLY ONE category. Analyze carefully and choose the most specific matching category for each input.
+
+"""
+    + _ROUTER_CATEGORIES
+    + """Instructions:
+- Return a JSON object whose "routes" array holds exactly one category per input, in the same order as the inputs
+- Choose ONE category only for each input
+- Select most specific matching category
+- Default to CONVERSATIONAL if unclear
+- Ignore politeness phrases or extra context
+- Focus on core intent of each request
+
+Inputs (JSON array): ${user_inputs}
+"""
+)
 
 CONNECT_WALLET: Final = """
 Extract a wallet address from the user input if present. If no wallet address is found, respond with an empty wallet_address.
 
-User Input: ${user_input}
-
 Instructions:
 - Look for an Ethereum-style wallet address (0x followed by 40 hexadecimal characters)
 - Return the wallet address if found
@@ -54,18 +76,35 @@ Example Response:
 {"wallet_address": "0x1234567890abcdef1234567890abcdef12345678"}
 or
 {"wallet_address": ""}
+
+User Input: ${user_input}
+"""
+
+CONNECT_WALLET_COMBINED: Final = """
+Extract a wallet address from the user input if present, and write both possible replies to the user.
+
+Instructions:
+- wallet_address: the Ethereum-style wallet address (0x followed by 40 hexadecimal characters) found in the input, or an empty string if no valid wallet address is found
+- success_message: a concise and friendly confirmation that the wallet has been connected successfully, including the wallet address and mentioning that the user can now send and swap tokens
+- instructions_message: clear and concise step-by-step instructions for connecting a wallet, mentioning common wallet extensions like MetaMask, Trust Wallet, or Coinbase Wallet, and explaining that the user should share their wallet address once connected
+- Format the response as a JSON object with the keys "wallet_address", "success_message" and "instructions_message"
+
+Example Response:
+{"wallet_address": "0x1234567890abcdef1234567890abcdef12345678", "success_message": "...", "instructions_message": "..."}
+
+User Input: ${user_input}
 """
 
 WALLET_CONNECTED: Final = """
 Generate a friendly response confirming that the wallet has been connected successfully.
 
-Connected Wallet Address: ${address}
-
 Instructions:
 - Confirm the wallet has been connected successfully
 - Include the wallet address in the response
 - Mention that the user can now send and swap tokens
 - Keep the response concise and friendly
+
+Connected Wallet Address: ${address}
 """
 
 WALLET_CONNECTION_INSTRUCTIONS: Final = """
@@ -98,7 +137,7 @@ Generate a welcoming message that includes ALL of these elements in order:
    - Private keys never leave the secure enclave
    - Hardware-level protection against tampering
 3. Account address display:
-   - EXACTLY as provided, make no changes: ${address}
+   - The account address given at the end, EXACTLY as provided, make no changes
    - Format with clear visual separation
 4. Funding account instructions:
    - Tell the user to fund the new account: [Add funds to account](https://faucet.flare.network/coston2)
@@ -116,6 +155,8 @@ keeping your private keys safe and secure, you freely share your
 public address: 0x123...
 [Add funds to account](https://faucet.flare.network/coston2)
 Ready to start exploring the Flare network?"
+
+Account address: ${address}
 """
 
 TOKEN_SEND: Final = """
@@ -142,8 +183,6 @@ Extract EXACTLY two pieces of information from the input text for a token send o
    • Extract first valid number only
    • FAIL if no valid amount found
 
-Input: ${user_input}
-
 Rules:
 - Both fields MUST be present
 - Amount MUST be positive
@@ -151,6 +190,8 @@ Rules:
 - DO NOT infer missing values
 - DO NOT modify the address
 - FAIL if either value is missing or invalid
+
+Input: ${user_input}
 """
 
 TOKEN_SWAP: Final = """
@@ -184,8 +225,6 @@ Extract EXACTLY three pieces of information from the input for a token swap oper
    • Amount MUST be positive
    • FAIL if no valid amount found
 
-Input: ${user_input}
-
 Response format:
 {
   "from_token": "<UPPERCASE_TOKEN_SYMBOL>",
@@ -207,6 +246,8 @@ Examples:
 ✓ "exchange 50.5 flr for usdc" → {"from_token": "FLR", "to_token": "USDC", "amount": 50.5}
 ✗ "swap flr to flr" → FAIL (same token)
 ✗ "swap tokens" → FAIL (missing amount)
+
+Input: ${user_input}
 """
 
 CONVERSATIONAL: Final = """
@@ -253,12 +294,12 @@ A user wants to perform a remote attestation with the TEE, make the following pr
 TX_CONFIRMATION: Final = """
 Generate a friendly response confirming a transaction has been processed.
 
-Transaction Information: ${tx_hash}
-Block Explorer URL: ${block_explorer}
-
 Instructions:
 - If the transaction information starts with "tx_data:", explain that the transaction data has been prepared and will be sent to the wallet extension for signing
 - If the transaction information starts with "0x", confirm the transaction has been sent successfully and include the transaction hash
 - Provide a link to view the transaction on the block explorer if a transaction hash is available
 - Keep the response concise and friendly
+
+Block Explorer URL: ${block_explorer}
+Transaction Information: ${tx_hash}
 """
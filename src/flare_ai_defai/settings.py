@@ -28,8 +28,26 @@ class Settings(BaseSettings):
     gemini_api_key: str = ""
     # The Gemini model identifier to use
     gemini_model: str = "gemini-1.5-flash"
+    # Maximum number of concurrent requests to Gemini per worker
+    gemini_max_concurrency: int = 8
+    # Milliseconds to collect semantic routing requests into one batch
+    router_batch_window_ms: float = 15.0
+    # Maximum number of messages classified per semantic routing request
+    router_max_batch: int = 16
+    # The Gemini model used for embeddings (semantic response cache)
+    gemini_embedding_model: str = "models/text-embedding-004"
+    # Maximum number of exact-match entries in the response cache
+    response_cache_size: int = 4096
+    # Seconds before a cached model response expires
+    response_cache_ttl: float = 3600.0
+    # Enable embedding-similarity lookups in the response cache
+    semantic_cache_enabled: bool = False
+    # Minimum cosine similarity for a semantic cache hit
+    semantic_cache_threshold: float = 0.92
     # API version to use at the backend
     api_version: str = "v1"
+    # Minimum log level, calls below it are dropped before any processing
+    log_level: str = "INFO"
     # URL for the Flare Network RPC provider
     web3_provider_url: str = "https://coston2-api.flare.network/ext/C/rpc"
     # URL for the Flare Network block explorer
@@ -47,4 +65,5 @@ class Settings(BaseSettings):
 
 # Create a global settings instance
 settings = Settings()
+structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(settings.log_level.upper()))
 logger.debug("settings", settings=settings.model_dump())
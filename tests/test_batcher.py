@@ -0,0 +1,55 @@
+import asyncio
+import json
+from typing import Any
+
+from flare_ai_defai.ai import ModelResponse
+from flare_ai_defai.api.routes.batcher import SemanticRouterBatcher
+from flare_ai_defai.exceptions import RoutingError
+from flare_ai_defai.prompts import PromptService, SemanticRouterResponse
+
+
+class FakeRouterAI:
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    async def agenerate(self, prompt: str, *_: Any, **__: Any) -> ModelResponse:
+        self.prompts.append(prompt)
+        inputs = json.loads(prompt.split("Inputs (JSON array): ")[1].split("\n", maxsplit=1)[0])
+        routes = [
+            "Unknown" if "?" in text else "SendToken" if "send" in text else "Conversational"
+            for text in inputs
+        ]
+        return ModelResponse(text=json.dumps({"routes": routes}), raw_response=None, metadata={})
+
+
+def test_concurrent_messages_share_one_request() -> None:
+    ai = FakeRouterAI()
+    batcher = SemanticRouterBatcher(ai, PromptService(), window_ms=50)  # pyright: ignore [reportArgumentType]
+
+    async def route_all() -> tuple[SemanticRouterResponse, ...]:
+        return await asyncio.gather(
+            batcher.submit("send tokens to bob"),
+            batcher.submit("hello there"),
+            batcher.submit("please send some FLR"),
+        )
+
+    routes = asyncio.run(route_all())
+    assert list(routes) == [
+        SemanticRouterResponse.SEND_TOKEN,
+        SemanticRouterResponse.CONVERSATIONAL,
+        SemanticRouterResponse.SEND_TOKEN,
+    ]
+    assert len(ai.prompts) == 1
+
+
+def test_unknown_route_fails_only_its_message() -> None:
+    batcher = SemanticRouterBatcher(FakeRouterAI(), PromptService(), window_ms=50)  # pyright: ignore [reportArgumentType]
+
+    async def route_all() -> tuple[SemanticRouterResponse | BaseException, ...]:
+        return await asyncio.gather(
+            batcher.submit("what???"), batcher.submit("send tokens"), return_exceptions=True
+        )
+
+    unknown, route = asyncio.run(route_all())
+    assert isinstance(unknown, RoutingError)
+    assert route == SemanticRouterResponse.SEND_TOKEN
@@ -1,7 +1,76 @@
-from flare_ai_defai.blockchain import FlareProvider
+import pytest
+from web3.types import Nonce, Wei
+
+from flare_ai_defai.blockchain import FlareProvider, flare
 
 
 def test_generate_account() -> None:
     service = FlareProvider("http://localhost:8545")
     address = service.generate_account()
     assert address.startswith("0x")
+
+
+WALLET = "0x" + "ab" * 20
+OTHER_WALLET = "0x" + "ef" * 20
+
+
+def test_sessions_are_isolated(blockchain_service: FlareProvider) -> None:
+    blockchain_service.connect_wallet("alice", WALLET)
+    blockchain_service.add_tx_to_queue(
+        "alice", msg="send", tx={"to": "0x" + "cd" * 20, "value": Wei(1)}
+    )
+    blockchain_service.connect_wallet("bob", OTHER_WALLET)
+
+    alice, bob = blockchain_service.get_session("alice"), blockchain_service.get_session("bob")
+    assert alice.address is not None
+    assert alice.address.lower() == WALLET
+    assert bob.address is not None
+    assert bob.address.lower() == OTHER_WALLET
+    assert len(alice.tx_queue) == 1
+    assert not bob.tx_queue
+
+
+def test_invalid_address_does_not_create_session(
+    blockchain_service: FlareProvider, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(flare, "MAX_SESSIONS", 1)
+    blockchain_service.connect_wallet("alice", WALLET)
+    with pytest.raises(ValueError, match="hex string"):
+        blockchain_service.connect_wallet("mallory", "0xnot-an-address")
+    # Had a session been created for mallory, it would have evicted alice's
+    assert blockchain_service.get_session("alice").address is not None
+    assert blockchain_service.get_session("mallory").address is None
+
+
+def test_least_recently_used_session_is_evicted(
+    blockchain_service: FlareProvider, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(flare, "MAX_SESSIONS", 2)
+    blockchain_service.connect_wallet("alice", WALLET)
+    blockchain_service.connect_wallet("bob", WALLET)
+    blockchain_service.get_session("alice")
+    blockchain_service.connect_wallet("carol", WALLET)
+    assert blockchain_service.get_session("alice").address is not None
+    assert blockchain_service.get_session("bob").address is None
+
+
+def test_sent_tx_advances_nonce(blockchain_service: FlareProvider) -> None:
+    blockchain_service.connect_wallet("user", WALLET)
+    session = blockchain_service.get_session("user")
+    session.nonce = nonce = 5
+    for msg in ("send", "send again"):
+        blockchain_service.add_tx_to_queue(
+            "user",
+            msg=msg,
+            tx={"to": "0x" + "cd" * 20, "value": Wei(1), "nonce": Nonce(nonce)},
+        )
+    # Unconfirmed previews do not consume a nonce
+    assert session.nonce == nonce
+
+    blockchain_service.send_tx_in_queue("user")
+    assert session.nonce == nonce + 1
+
+    # Confirming an older preview does not move the nonce back
+    session.nonce = nonce + 3
+    blockchain_service.send_tx_in_queue("user")
+    assert session.nonce == nonce + 3
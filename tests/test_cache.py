@@ -0,0 +1,42 @@
+from flare_ai_defai.ai import ResponseCache
+
+
+def test_exact_hit_is_normalized() -> None:
+    cache = ResponseCache()
+    cache.put("semantic_router", "Connect wallet", "ConnectWallet")
+    assert cache.get("semantic_router", "  connect   WALLET? ") == "ConnectWallet"
+    assert cache.get("conversational", "connect wallet") is None
+
+
+def test_semantic_hit_above_threshold() -> None:
+    cache = ResponseCache(similarity_threshold=0.9, semantic=True)
+    cache.put("semantic_router", "connect wallet", "ConnectWallet", embedding=[1.0, 0.0])
+    assert cache.get("semantic_router", "link my wallet", [0.99, 0.05]) == "ConnectWallet"
+    assert cache.get("semantic_router", "hello there", [0.0, 1.0]) is None
+
+
+def test_expired_entries_miss() -> None:
+    cache = ResponseCache(ttl=0.0)
+    cache.put("semantic_router", "connect wallet", "ConnectWallet", embedding=[1.0, 0.0])
+    assert cache.get("semantic_router", "connect wallet", [1.0, 0.0]) is None
+
+
+def test_lru_eviction() -> None:
+    cache = ResponseCache(max_size=1)
+    cache.put("conversational", "hi", "Hello")
+    cache.put("conversational", "bye", "Goodbye")
+    assert cache.get("conversational", "hi") is None
+    assert cache.get("conversational", "bye") == "Goodbye"
+
+
+def test_digits_are_not_cacheable() -> None:
+    assert not ResponseCache.is_cacheable("send 10 FLR")
+    assert ResponseCache.is_cacheable("what is attestation")
+
+
+def test_exact_lookup_skips_semantic_tier() -> None:
+    cache = ResponseCache(semantic=True)
+    cache.put("semantic_router", "connect wallet", "ConnectWallet", embedding=[1.0, 0.0])
+    assert cache.get_exact("semantic_router", "Connect wallet!") == "ConnectWallet"
+    assert cache.get_exact("semantic_router", "link my wallet") is None
+    assert (cache.hits, cache.misses) == (1, 0)
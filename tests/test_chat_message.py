@@ -0,0 +1,62 @@
+import asyncio
+from http import HTTPStatus
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI, HTTPException, Response
+from starlette.requests import Request
+
+from flare_ai_defai.api import ChatMessage, ChatRouter, parse_msg
+from flare_ai_defai.prompts import PromptService
+
+
+def _request(body: bytes = b"", cookie: str | None = None) -> Request:
+    async def receive() -> dict[str, object]:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    headers = [(b"cookie", f"session_id={cookie}".encode())] if cookie else []
+    return Request({"type": "http", "method": "POST", "headers": headers}, receive)
+
+
+def test_parse_msg_decodes_body() -> None:
+    body = b'{"message": "hello", "wallet_address": "0xabc"}'
+    message = asyncio.run(parse_msg(_request(body)))
+    assert message == ChatMessage(message="hello", wallet_address="0xabc")
+
+
+def test_parse_msg_defaults_wallet_address() -> None:
+    message = asyncio.run(parse_msg(_request(b'{"message": "hello"}')))
+    assert message.wallet_address is None
+
+
+@pytest.mark.parametrize(
+    "body", [b'{"message": ""}', b'{"wallet_address": "0xabc"}', b'{"message": 1}', b"not json"]
+)
+def test_parse_msg_rejects_invalid_body(body: bytes) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(parse_msg(_request(body)))
+    assert exc_info.value.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_anonymous_clients_get_distinct_sessions() -> None:
+    message = ChatMessage(message="connect my wallet")
+    first, second = Response(), Response()
+    first_id = ChatRouter.client_id(_request(), first)
+    second_id = ChatRouter.client_id(_request(), second)
+    assert "session_id=" in first.headers["set-cookie"]
+    assert ChatRouter.session_key(message, first_id) != ChatRouter.session_key(message, second_id)
+
+    # A returning client keeps its id and is not issued a new cookie
+    returning = Response()
+    assert ChatRouter.client_id(_request(cookie=first_id), returning) == first_id
+    assert "set-cookie" not in returning.headers
+
+
+def test_openapi_documents_request_body() -> None:
+    chat = ChatRouter(MagicMock(), MagicMock(), MagicMock(), PromptService())
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/api/routes/chat")
+    operation = app.openapi()["paths"]["/api/routes/chat/"]["post"]
+    schema = operation["requestBody"]["content"]["application/json"]["schema"]
+    assert schema["required"] == ["message"]
+    assert set(schema["properties"]) == {"message", "wallet_address"}
@@ -0,0 +1,87 @@
+import asyncio
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from flare_ai_defai.ai import ModelResponse
+from flare_ai_defai.api import ChatRouter
+from flare_ai_defai.blockchain import FlareProvider
+from flare_ai_defai.prompts import PromptService
+
+WALLET = "0x" + "ab" * 20
+RECIPIENT = "0x" + "cd" * 20
+
+
+class FakeAI:
+    def __init__(self, prompts: PromptService, replies: dict[str, str | Exception]) -> None:
+        self.replies = {
+            prompts.library.get_prompt(name).template[:40]: reply for name, reply in replies.items()
+        }
+
+    async def agenerate(self, prompt: str, *_: Any, **__: Any) -> ModelResponse:
+        reply = next(r for head, r in self.replies.items() if prompt.startswith(head))
+        if isinstance(reply, Exception):
+            raise reply
+        return ModelResponse(text=reply, raw_response=None, metadata={})
+
+
+def _router(ai: FakeAI, prompts: PromptService, blockchain: Any) -> ChatRouter:
+    return ChatRouter(ai, blockchain, MagicMock(), prompts)  # pyright: ignore [reportArgumentType]
+
+
+def _blockchain() -> FlareProvider:
+    blockchain = FlareProvider("http://localhost:8545")
+    blockchain.prefetch_tx_fields = AsyncMock()
+    blockchain.create_send_flr_tx = AsyncMock(return_value={"to": RECIPIENT, "value": 1})
+    return blockchain
+
+
+def test_send_token_ignores_failed_follow_up() -> None:
+    prompts = PromptService()
+    extraction = json.dumps({"to_address": RECIPIENT, "amount": 1.5})
+    ai = FakeAI(prompts, {"token_send": extraction, "follow_up_token_send": RuntimeError("429")})
+    blockchain = _blockchain()
+    blockchain.connect_wallet("user", WALLET)
+
+    reply = asyncio.run(_router(ai, prompts, blockchain).handle_send_token("send", "user"))
+    assert reply["response"].startswith("Transaction Preview: Sending 1.5 FLR")
+    assert len(blockchain.get_session("user").tx_queue) == 1
+
+
+def test_send_token_falls_back_to_follow_up() -> None:
+    prompts = PromptService()
+    extraction = json.dumps({"to_address": "", "amount": 0.0})
+    ai = FakeAI(prompts, {"token_send": extraction, "follow_up_token_send": "Who to?"})
+    blockchain = _blockchain()
+    blockchain.connect_wallet("user", WALLET)
+
+    reply = asyncio.run(_router(ai, prompts, blockchain).handle_send_token("send", "user"))
+    assert reply == {"response": "Who to?"}
+    assert not blockchain.get_session("user").tx_queue
+
+
+def test_connect_wallet_uses_combined_reply() -> None:
+    prompts = PromptService()
+    combined = json.dumps(
+        {"wallet_address": WALLET, "success_message": "Connected", "instructions_message": "How"}
+    )
+    ai = FakeAI(prompts, {"connect_wallet_combined": combined})
+    blockchain = _blockchain()
+
+    reply = asyncio.run(_router(ai, prompts, blockchain).handle_connect_wallet("hi", "user"))
+    assert reply == {"response": "Connected"}
+    assert blockchain.get_session("user").address is not None
+
+
+def test_connect_wallet_with_missing_reply_does_not_connect() -> None:
+    prompts = PromptService()
+    combined = json.dumps({"wallet_address": WALLET, "instructions_message": "How"})
+    ai = FakeAI(
+        prompts,
+        {"connect_wallet_combined": combined, "wallet_connection_instructions": "Instructions"},
+    )
+    blockchain = _blockchain()
+
+    reply = asyncio.run(_router(ai, prompts, blockchain).handle_connect_wallet("hi", "user"))
+    assert reply == {"response": "Instructions"}
+    assert blockchain.get_session("user").address is None
@@ -0,0 +1,42 @@
+import pytest
+
+from flare_ai_defai.ai import safe_json_loads
+
+SEND_TOKEN_KEYS = ("to_address", "amount")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"to_address": "0xabc", "amount": 1.5}',
+        '```json\n{"to_address": "0xabc", "amount": 1.5}\n```',
+        '{"to_address": "0xabc", "amount": 1.5,}',
+        'Here you go: {"to_address": "0xabc", "amount": 1.5} Let me know!',
+        '{"to_address": "0xabc", "amount": 1.5, "note": "sending',
+        '{"to_address": "0xabc", "amount": 1.5, "note":',
+        '{"to_address": "0xabc", "amount": 1.5, "no',
+    ],
+)
+def test_safe_json_loads_recovers(text: str) -> None:
+    data = safe_json_loads(text, SEND_TOKEN_KEYS)
+    assert data["to_address"] == "0xabc"
+    assert data["amount"] == pytest.approx(1.5)
+
+
+@pytest.mark.parametrize(
+    ("text", "match"),
+    [
+        ("I could not find an address in your message.", "Expecting value"),
+        ('{"to_address": "0xabc"}', "Missing required keys: amount"),
+        ('["0xabc", 1.5]', "Expected a JSON object"),
+        ('{"to_address": "0xabc", "amount": tr', "Expecting"),
+    ],
+)
+def test_safe_json_loads_rejects(text: str, match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        safe_json_loads(text, SEND_TOKEN_KEYS)
+
+
+def test_commas_inside_strings_are_kept() -> None:
+    data = safe_json_loads('{"note": "a, }", "amount": 1,}')
+    assert data == {"note": "a, }", "amount": 1}
@@ -1,6 +1,8 @@
+from dataclasses import replace
+
 import pytest
 
-from flare_ai_defai.prompts import PromptLibrary
+from flare_ai_defai.prompts import PromptLibrary, PromptService
 
 
 def test_prompt_library_initialization() -> None:
@@ -21,3 +23,65 @@ def test_prompt_missing_inputs() -> None:
     prompt = library.get_prompt("generate_account")
     with pytest.raises(ValueError, match="Missing required inputs: address"):
         prompt.format(wrong_input="test")
+
+
+def test_prompt_inputs_follow_static_prefix() -> None:
+    # Inputs come last so every call to a prompt shares its static prefix
+    library = PromptLibrary()
+    for prompt in library.prompts.values():
+        _, _, tail = prompt.template.partition("${")
+        trailing = [line for line in tail.splitlines()[1:] if line.strip()]
+        assert all("${" in line or line.startswith("</") for line in trailing), prompt.name
+
+
+def test_service_caches_static_prompts() -> None:
+    service = PromptService()
+    first = service.get_formatted_prompt("wallet_connection_instructions")
+    assert service.get_formatted_prompt("wallet_connection_instructions") is first
+    assert (
+        "test message" in service.get_formatted_prompt("token_send", user_input="test message")[0]
+    )
+
+
+def test_service_cache_follows_replaced_prompts() -> None:
+    service = PromptService(PromptLibrary())
+    service.get_formatted_prompt("wallet_required")
+    service.library.add_prompt(
+        replace(service.library.get_prompt("wallet_required"), template="NEW")
+    )
+    assert service.get_formatted_prompt("wallet_required")[0] == "NEW"
+
+
+def test_prompts_by_category_follow_replacements() -> None:
+    library = PromptLibrary()
+    router_prompts = library.get_prompts_by_category("router")
+    assert {p.name for p in router_prompts} == {"semantic_router", "semantic_router_batch"}
+
+    moved = replace(library.get_prompt("semantic_router"), category="custom")
+    library.add_prompt(moved)
+    assert [p.name for p in library.get_prompts_by_category("router")] == ["semantic_router_batch"]
+    assert library.get_prompts_by_category("custom") == [moved]
+    assert "custom" in library.list_categories()
+
+
+def test_default_library_is_shared() -> None:
+    assert PromptLibrary.default() is PromptLibrary.default()
+    assert PromptService().library is PromptLibrary.default()
+
+
+def test_library_from_custom_prompts() -> None:
+    prompt = PromptLibrary.default().get_prompt("conversational")
+    library = PromptLibrary({prompt.name: prompt})
+    assert list(library.prompts) == ["conversational"]
+    assert library.list_categories() == ["conversation"]
+
+
+def test_category_cache_invalidated_on_add() -> None:
+    prompt = PromptLibrary.default().get_prompt("conversational")
+    library = PromptLibrary({prompt.name: prompt})
+    categories = library.list_categories()
+    categories.append("mutated")
+    assert library.list_categories() == ["conversation"]
+
+    library.add_prompt(replace(prompt, name="extra", category="extra"))
+    assert library.list_categories() == ["conversation", "extra"]
@@ -0,0 +1,22 @@
+import pytest
+from web3 import Web3
+
+from flare_ai_defai.blockchain import flr_to_wei, wei_to_flr
+
+
+@pytest.mark.parametrize(
+    "amount",
+    [0.0, 0.1, 1.5, 1.1, 100.0, 123456.789, 0.000001, 1e-20, 3e20, 10, 0.30000000000000004],
+)
+def test_flr_to_wei_matches_web3(amount: float) -> None:
+    assert flr_to_wei(amount) == Web3.to_wei(amount, "ether")
+
+
+def test_flr_to_wei_rejects_negative() -> None:
+    with pytest.raises(ValueError, match="between 0"):
+        flr_to_wei(-1.0)
+
+
+@pytest.mark.parametrize("value_wei", [0, 100_000_000_000_000_000, 1_500_000_000_000_000_000])
+def test_wei_to_flr_round_trips(value_wei: int) -> None:
+    assert flr_to_wei(wei_to_flr(value_wei)) == value_wei